@@ -1,5 +1,6 @@
 import pygame
 import random
+import numpy as np
 
 from Assets.GameBalance import PLAYER, ENEMY, SMALL_BANDIT, LARGE_BANDIT, EXPERIENCE, get_enemy_stats, get_player_level_stats
 from Assets.AttackConfig import AttackConfig
@@ -62,13 +63,17 @@ class CharacterBase:
             
             # Handle horizontal collisions
             if rects:
-                for rect in rects:
-                    if self.rect.colliderect(rect):
-                        if self.velocity_x > 0:  # Moving right
-                            self.rect.right = rect.left
-                        else:  # Moving left
-                            self.rect.left = rect.right
-                        self.velocity_x = 0
+                self._resolve_horizontal_collisions(rects)
+
+    def _resolve_horizontal_collisions(self, rects):
+        """Push out of any solid rects after a horizontal move"""
+        for rect in rects:
+            if self.rect.colliderect(rect):
+                if self.velocity_x > 0:  # Moving right
+                    self.rect.right = rect.left
+                else:  # Moving left
+                    self.rect.left = rect.right
+                self.velocity_x = 0
 
     def apply_gravity(self, gravity=0.8, max_fall=14, rects=None):
         """Apply gravity and handle vertical collisions"""
@@ -80,15 +85,19 @@ class CharacterBase:
         self.rect.y += self.y_momentum
         
         if rects:
-            for rect in rects:
-                if self.rect.colliderect(rect):
-                    if self.y_momentum > 0:  # Falling
-                        self.rect.bottom = rect.top
-                        self.y_momentum = 0
-                        self.on_ground = True
-                    elif self.y_momentum < 0:  # Rising
-                        self.rect.top = rect.bottom
-                        self.y_momentum = 0
+            self._resolve_vertical_collisions(rects)
+
+    def _resolve_vertical_collisions(self, rects):
+        """Land on / bump into solid rects after a vertical move"""
+        for rect in rects:
+            if self.rect.colliderect(rect):
+                if self.y_momentum > 0:  # Falling
+                    self.rect.bottom = rect.top
+                    self.y_momentum = 0
+                    self.on_ground = True
+                elif self.y_momentum < 0:  # Rising
+                    self.rect.top = rect.bottom
+                    self.y_momentum = 0
     
     def teleport_jump(self, rects, distance):
         """Teleport upward by distance pixels, stopping at obstacles"""
@@ -1047,6 +1056,11 @@ class Merchant(CharacterBase):
         super().__init__(x, y, 32, 48, stats=merchant_stats)
 
 class EnemyBase(CharacterBase):
+    # Health bar shared by every enemy (template is built on first draw)
+    HEALTH_BAR_WIDTH = 40
+    HEALTH_BAR_HEIGHT = 4
+    _health_bar_template = None
+    
     def __init__(self, x=0, y=0, width=48, height=48, speed=5, stats=None):
         super().__init__(x, y, width, height, speed, stats)
         
@@ -1092,8 +1106,16 @@ class EnemyBase(CharacterBase):
         self.hit_stun_frames = 0
         self.hit_flash_timer = 0
     
-    def update_ai(self, player, collision_rects, gravity=0.7, max_fall=12, dt=0.016, current_beat=1, current_frame=0):
-        """Simple AI: Chase player when within 500px, patrol otherwise"""
+    def reset(self, x, y):
+        """Bring a pooled enemy back as if it had just been created at (x, y)"""
+        type(self).__init__(self, x, y)
+    
+    def update_ai(self, player, collision_rects, gravity=0.7, max_fall=12, dt=0.016, current_beat=1, current_frame=0, apply_physics=True):
+        """Simple AI: Chase player when within 500px, patrol otherwise
+        
+        Pass apply_physics=False when the caller steps gravity/movement for the
+        whole group afterwards with step_enemy_physics().
+        """
         if not self.is_alive():
             self.state = "dead"
             return
@@ -1105,8 +1127,9 @@ class EnemyBase(CharacterBase):
         if self.is_stunned:
             self.moving_left = False
             self.moving_right = False
-            self.apply_gravity(gravity, max_fall, collision_rects)
-            self.move(collision_rects)
+            if apply_physics:
+                self.apply_gravity(gravity, max_fall, collision_rects)
+                self.move(collision_rects)
             return
         
         # Simple AI decision: Chase if player is within 500 pixels
@@ -1123,8 +1146,9 @@ class EnemyBase(CharacterBase):
         self.update_attack_system(player, dt, current_beat)
         
         # Apply physics
-        self.apply_gravity(gravity, max_fall, collision_rects)
-        self.move(collision_rects)
+        if apply_physics:
+            self.apply_gravity(gravity, max_fall, collision_rects)
+            self.move(collision_rects)
     
     def _patrol(self):
         if self.rect.centerx <= self.patrol_left:
@@ -1258,7 +1282,11 @@ class EnemyBase(CharacterBase):
     def take_damage(self, damage, is_magical=False):
         """Override to add hit stun and cancel attacks"""
         actual_damage = super().take_damage(damage, is_magical)
-        
+        self._on_hit()
+        return actual_damage
+    
+    def _on_hit(self):
+        """Hit reaction shared by take_damage() and apply_damage_batch()"""
         # Add hit stun - can't attack for a bit
         self.hit_stun_frames = 20  # Stunned for 20 frames
         
@@ -1267,8 +1295,6 @@ class EnemyBase(CharacterBase):
         self.is_executing_attack = False
         self.telegraph_frame = 0
         self.attack_execution_frame = 0
-        
-        return actual_damage
     
     def _execute_attack(self, player, attack_type):
         distance = abs(player.rect.centerx - self.rect.centerx)
@@ -1322,23 +1348,35 @@ class EnemyBase(CharacterBase):
             screen.blit(glow_surf, (screen_rect.x - glow_size//2, screen_rect.y - glow_size//2))
         
         # Draw health bar above enemy
-        health_bar_width = 40
-        health_bar_height = 4
+        health_bar_width = EnemyBase.HEALTH_BAR_WIDTH
         health_ratio = self.stats['Current_Health'] / self.stats['Max_Health']
+        health_ratio = max(0, min(1, health_ratio))
         
         bar_x = screen_rect.centerx - health_bar_width // 2
         bar_y = screen_rect.top - 8
         
-        # Background (red)
-        pygame.draw.rect(screen, (255, 0, 0), (bar_x, bar_y, health_bar_width, health_bar_height))
-        # Foreground (green)
-        pygame.draw.rect(screen, (0, 255, 0), (bar_x, bar_y, int(health_bar_width * health_ratio), health_bar_height))
+        # One blit: slide a bar-sized window over the green|red template
+        green_width = int(health_bar_width * health_ratio)
+        template = EnemyBase._get_health_bar_template()
+        screen.blit(template, (bar_x, bar_y),
+                    area=(health_bar_width - green_width, 0, health_bar_width, EnemyBase.HEALTH_BAR_HEIGHT))
+    
+    @staticmethod
+    def _get_health_bar_template():
+        """Build (once) a double-width strip: green on the left half, red on the right"""
+        if EnemyBase._health_bar_template is None:
+            width = EnemyBase.HEALTH_BAR_WIDTH
+            template = pygame.Surface((width * 2, EnemyBase.HEALTH_BAR_HEIGHT))
+            template.fill((0, 255, 0), (0, 0, width, EnemyBase.HEALTH_BAR_HEIGHT))
+            template.fill((255, 0, 0), (width, 0, width, EnemyBase.HEALTH_BAR_HEIGHT))
+            EnemyBase._health_bar_template = template
+        return EnemyBase._health_bar_template
 
 
 class SmallBandit(EnemyBase):
     """Small Bandit - Level 1-5"""
     def __init__(self, x=0, y=0):
-        stats_config = SMALL_BANDIT.copy()
+        stats_config = SMALL_BANDIT
         small_bandit_stats = {
             'Current_Health': stats_config['max_health'],
             'Max_Health': stats_config['max_health'],
@@ -1364,7 +1402,7 @@ class SmallBandit(EnemyBase):
 class LargeBandit(EnemyBase):
     """Large Bandit - Level 6-10"""
     def __init__(self, x=0, y=0):
-        stats_config = LARGE_BANDIT.copy()
+        stats_config = LARGE_BANDIT
         large_bandit_stats = {
             'Current_Health': stats_config['max_health'],
             'Max_Health': stats_config['max_health'],
@@ -1385,4 +1423,103 @@ class LargeBandit(EnemyBase):
         self.color = stats_config['color']
         self.detection_range = 220
         self.chase_speed_multiplier = 1.1
-        self.jump_height_threshold = 120
\ No newline at end of file
+        self.jump_height_threshold = 120
+
+
+# ==================== BATCHED ENEMY PHYSICS ====================
+def _round_half_away(values):
+    """Round like pygame.Rect does when assigned a float (0.5 rounds away from zero)"""
+    return np.where(values >= 0, np.floor(values + 0.5), np.ceil(values - 0.5)).astype(np.int64)
+
+
+def _overlapping(enemies, solid):
+    """Return indices of enemies whose rect overlaps any solid (left, top, right, bottom) row"""
+    boxes = np.array([(e.rect.left, e.rect.top, e.rect.right, e.rect.bottom) for e in enemies], dtype=np.int64)
+    hit = ((boxes[:, None, 0] < solid[None, :, 2]) & (boxes[:, None, 2] > solid[None, :, 0]) &
+           (boxes[:, None, 1] < solid[None, :, 3]) & (boxes[:, None, 3] > solid[None, :, 1]))
+    return np.flatnonzero(hit.any(axis=1))
+
+
+def step_enemy_physics(enemies, rects, gravity=0.7, max_fall=12):
+    """Apply gravity then horizontal movement to a group of enemies in one pass
+    
+    Same result as calling apply_gravity() and move() on each enemy, but the
+    integration runs as array math over the whole group and only enemies that
+    end up overlapping a collision rect go through per-enemy resolution.
+    
+    Args:
+        enemies: Enemies to step (already updated by update_ai(apply_physics=False))
+        rects: Collision rects for this frame
+        gravity: Gravity added to y_momentum
+        max_fall: Terminal falling speed
+    """
+    if not enemies:
+        return
+    count = len(enemies)
+    solid = np.array([(r.left, r.top, r.right, r.bottom) for r in rects], dtype=np.int64).reshape(-1, 4)
+    
+    # ----- Vertical: gravity -----
+    y_momentum = np.fromiter((e.y_momentum for e in enemies), dtype=np.float64, count=count)
+    y_momentum += gravity
+    np.minimum(y_momentum, max_fall, out=y_momentum)
+    ys = _round_half_away(np.fromiter((e.rect.y for e in enemies), dtype=np.float64, count=count) + y_momentum)
+    for enemy, y, momentum in zip(enemies, ys.tolist(), y_momentum.tolist()):
+        enemy.on_ground = False
+        enemy.y_momentum = momentum
+        enemy.rect.y = y
+    if len(solid):
+        for i in _overlapping(enemies, solid):
+            enemies[i]._resolve_vertical_collisions(rects)
+    
+    # ----- Horizontal: acceleration / friction -----
+    stunned = np.fromiter((e.is_stunned for e in enemies), dtype=bool, count=count)
+    left = np.fromiter((e.moving_left for e in enemies), dtype=bool, count=count)
+    right = np.fromiter((e.moving_right for e in enemies), dtype=bool, count=count) & ~left
+    velocity = np.fromiter((e.velocity_x for e in enemies), dtype=np.float64, count=count)
+    speed = np.fromiter((e.speed for e in enemies), dtype=np.float64, count=count)
+    accel = np.fromiter((e.acceleration for e in enemies), dtype=np.float64, count=count)
+    friction = np.fromiter((e.friction for e in enemies), dtype=np.float64, count=count)
+    
+    coasting = ~(left | right)
+    velocity = np.where(left, np.maximum(velocity - accel, -speed),
+                        np.where(right, np.minimum(velocity + accel, speed), velocity * friction))
+    velocity[coasting & (np.abs(velocity) < 0.1)] = 0
+    moved = ~stunned & (velocity != 0)
+    xs = _round_half_away(np.fromiter((e.rect.x for e in enemies), dtype=np.float64, count=count) + velocity)
+    
+    for i, enemy in enumerate(enemies):
+        if stunned[i]:
+            # Stunned enemies drop their input and don't move (see move())
+            enemy.moving_left = False
+            enemy.moving_right = False
+            continue
+        enemy.velocity_x = velocity[i].item()
+        if moved[i]:
+            enemy.rect.x = xs[i].item()
+    if len(solid) and moved.any():
+        movers = np.flatnonzero(moved)
+        for i in movers[_overlapping([enemies[j] for j in movers], solid)]:
+            enemies[i]._resolve_horizontal_collisions(rects)
+
+
+def apply_damage_batch(enemies, damage, is_magical=False):
+    """Apply the same hit to several enemies at once
+    
+    Health and defense are gathered into arrays, damage is subtracted in one
+    vector op and the results are written back to each enemy's stats. Same
+    result as calling take_damage() on each enemy.
+    
+    Args:
+        enemies: Enemies hit by the attack
+        damage: Raw damage before defense
+        is_magical: Use M_Defense instead of Defense
+    """
+    if not enemies:
+        return
+    defense_stat = 'M_Defense' if is_magical else 'Defense'
+    health = np.array([e.stats['Current_Health'] for e in enemies])
+    defense = np.array([e.stats.get(defense_stat, 0) for e in enemies])
+    health = np.maximum(health - np.maximum(1, damage - defense), 0)
+    for enemy, remaining in zip(enemies, health.tolist()):
+        enemy.stats['Current_Health'] = remaining
+        enemy._on_hit()
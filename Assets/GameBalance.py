@@ -1,4 +1,6 @@
 # Assets/GameBalance.py
+from functools import lru_cache
+from types import MappingProxyType
 
 # =============================================================================
 # PLAYER STATS
@@ -101,10 +103,32 @@ EXPERIENCE = {
     "exp_curve": 100,  # Each level needs this much more exp
 }
 
+# Balance tables are read-only config; expose them as views so callers can
+# index them directly instead of copying defensively
+PLAYER = MappingProxyType(PLAYER)
+ENEMY = MappingProxyType(ENEMY)
+SMALL_BANDIT = MappingProxyType(SMALL_BANDIT)
+LARGE_BANDIT = MappingProxyType(LARGE_BANDIT)
+EXPERIENCE = MappingProxyType(EXPERIENCE)
+
 # =============================================================================
 # HELPER FUNCTIONS
 # =============================================================================
 
+def _build_enemy_stats(base):
+    """Combine an enemy stat block with the shared enemy speed"""
+    stats = base.copy()
+    stats["speed"] = PLAYER["base_speed"] * ENEMY["speed_multiplier"]
+    return stats
+
+
+# Built once at import; get_enemy_stats hands out copies since enemies mutate their stats
+_ENEMY_STATS_CACHE = {
+    "small": _build_enemy_stats(SMALL_BANDIT),
+    "large": _build_enemy_stats(LARGE_BANDIT),
+}
+
+
 def get_enemy_stats(enemy_type):
     """Get balanced stats for an enemy type
     
@@ -115,14 +139,8 @@ def get_enemy_stats(enemy_type):
         Dictionary of enemy stats
     """
     if enemy_type == "small":
-        stats = SMALL_BANDIT.copy()
-    else:
-        stats = LARGE_BANDIT.copy()
-    
-    # Apply speed multiplier
-    stats["speed"] = PLAYER["base_speed"] * ENEMY["speed_multiplier"]
-    
-    return stats
+        return _ENEMY_STATS_CACHE["small"].copy()
+    return _ENEMY_STATS_CACHE["large"].copy()
 
 
 def get_player_level_stats(level):
@@ -134,6 +152,13 @@ def get_player_level_stats(level):
     Returns:
         Dictionary of stats at this level
     """
+    # Callers update the returned dict in place, so copy the memoized one
+    return _player_level_stats(level).copy()
+
+
+@lru_cache(maxsize=128)
+def _player_level_stats(level):
+    """Memoized stat block for a level (do not mutate)"""
     level_offset = level - 1
     return {
         "max_health": PLAYER["max_health"] + (EXPERIENCE["health_per_level"] * level_offset),
@@ -3,9 +3,93 @@ import pygame
 import random
 import time
 import math
+from functools import lru_cache
 from PIL import Image
 import os
+import numpy as np
 from Assets.Characters import SmallBandit
+from Assets.Menus import TravelMenu
+
+# Pre-filled translucent surfaces keyed by (width, height, color, alpha).
+# Config values are part of the key, so changing them simply misses the cache.
+_TINT_CACHE = {}
+
+
+def _get_tint_surface(width, height, color, alpha):
+    """Return a cached solid-color surface drawn at the given alpha
+    
+    The fill is uniform, so a plain surface with surface-level alpha is used
+    instead of per-pixel SRCALPHA: a quarter of the memory and a cheaper blit.
+    """
+    key = (width, height, color, alpha)
+    surface = _TINT_CACHE.get(key)
+    if surface is None:
+        surface = pygame.Surface((width, height))
+        surface.fill(color)
+        surface.set_alpha(alpha)
+        _TINT_CACHE[key] = surface
+    return surface
+
+
+def draw_interactables(screen, items, camera_x, camera_y, config, fallback=None):
+    """Draw interactables, batching translucent tinted rects into one blit call
+
+    Objects with a tint() (Bed, Merchant, Wall) that are translucent are queued
+    and submitted together; anything else flushes the queue first and draws
+    itself, so the on-screen stacking order is unchanged. Objects without a
+    draw method are passed to fallback(obj) if given.
+    """
+    blit_many = getattr(screen, "fblits", screen.blits)
+    offset_x = int(camera_x)  # Truncated like Rect.move, once for the whole batch
+    offset_y = int(camera_y)
+    batch = []
+    for obj in items:
+        tint = getattr(obj, "tint", None)
+        if tint is not None:
+            color, alpha = tint(config)
+            if alpha < 255:
+                if alpha > 0:  # Fully transparent rects draw nothing
+                    surface = _get_tint_surface(obj.rect.width, obj.rect.height, color, alpha)
+                    batch.append((surface, (obj.rect.x - offset_x, obj.rect.y - offset_y)))
+                continue
+        if batch:
+            blit_many(batch)
+            batch = []
+        if hasattr(obj, "draw"):
+            obj.draw(screen, camera_x, camera_y, config)
+        elif fallback is not None:
+            fallback(obj)
+    if batch:
+        blit_many(batch)
+
+
+# Pre-rendered slope triangles keyed by shape, colors, alpha and padding
+_TRIANGLE_CACHE = {}
+# Border around opaque triangles: pygame's 3px outline spills past the points
+_OUTLINE_PAD = 3
+
+
+def _get_triangle_surface(width, height, base_y, color, outline_color, alpha, pad=0):
+    """Return a cached SRCALPHA surface with an outlined triangle peaking at the top center
+    
+    pad adds a transparent border so the outline is not clipped at the edges;
+    blit the result pad pixels up and left of the triangle's bounding box.
+    """
+    key = (width, height, base_y, color, outline_color, alpha, pad)
+    surface = _TRIANGLE_CACHE.get(key)
+    if surface is None:
+        surface = pygame.Surface((width + 2 * pad, height + 2 * pad), pygame.SRCALPHA)
+        local_points = [
+            (pad, base_y + pad),
+            (width // 2 + pad, pad),
+            (width + pad, base_y + pad)
+        ]
+        pygame.draw.polygon(surface, (*color, alpha), local_points)
+        pygame.draw.polygon(surface, (*outline_color, alpha), local_points, 3)
+        _TRIANGLE_CACHE[key] = surface
+    return surface
+
+
 class Interactable:
     def __init__(self, x, y, width, height, collidable=True):
         self.rect = pygame.Rect(x, y, width, height)
@@ -21,7 +105,22 @@ class Interactable:
 # ----------------------------
 # BED
 # ----------------------------
+_REST_TEXT = None  # Rendered "Resting..." label, built on first use
+
+
+def _get_rest_text():
+    """Return the cached "Resting..." text surface shown while sleeping"""
+    global _REST_TEXT
+    if _REST_TEXT is None:
+        font_path = os.path.join("Assets", "Fonts", "Cavalhatriz.ttf")
+        font = pygame.font.Font(font_path if os.path.exists(font_path) else None, 72)
+        _REST_TEXT = font.render("Resting...", True, (255, 255, 255))
+    return _REST_TEXT
+
+
 class Bed(Interactable):
+    _fade_surface = None  # Opaque black overlay shared by all beds
+
     def __init__(self, x, y, width=64, height=32):
         super().__init__(x, y, width, height, collidable=True)
         self.bed_interaction_active = False
@@ -73,29 +172,35 @@ class Bed(Interactable):
         if not self.fade_active:
             return
         
-        # Draw black fade overlay
-        fade_surface = pygame.Surface(screen.get_size())
-        fade_surface.fill((0, 0, 0))
+        # Draw black fade overlay (one shared surface, rebuilt only if the screen size changes)
+        fade_surface = Bed._fade_surface
+        if fade_surface is None or fade_surface.get_size() != screen.get_size():
+            fade_surface = pygame.Surface(screen.get_size())
+            fade_surface.fill((0, 0, 0))
+            Bed._fade_surface = fade_surface
         fade_surface.set_alpha(int(self.fade_alpha))
         screen.blit(fade_surface, (0, 0))
         
         # Draw "Resting..." text during text phase
         if self.fade_phase == "text":
-            font_path = os.path.join("Assets", "Fonts", "Cavalhatriz.ttf")
-            font = pygame.font.Font(font_path if os.path.exists(font_path) else None, 72)
-            text = font.render("Resting...", True, (255, 255, 255))
+            text = _get_rest_text()
             text_rect = text.get_rect(center=(screen.get_width() // 2, screen.get_height() // 2))
             screen.blit(text, text_rect)
 
+    def tint(self, config):
+        """Fill color and alpha for this bed from config"""
+        return config.COLOR_BED, config.ALPHA_BED
+
     def draw(self, screen, camera_x, camera_y, config):
         """Draw bed with config colors"""
-        screen_rect = self.rect.move(-camera_x, -camera_y)
+        # int() truncates like Rect.move does, without allocating a Rect
+        x = self.rect.x - int(camera_x)
+        y = self.rect.y - int(camera_y)
         if config.ALPHA_BED < 255:
-            temp_surface = pygame.Surface((self.rect.width, self.rect.height), pygame.SRCALPHA)
-            temp_surface.fill((*config.COLOR_BED, config.ALPHA_BED))
-            screen.blit(temp_surface, screen_rect.topleft)
+            temp_surface = _get_tint_surface(self.rect.width, self.rect.height, config.COLOR_BED, config.ALPHA_BED)
+            screen.blit(temp_surface, (x, y))
         else:
-            pygame.draw.rect(screen, config.COLOR_BED, screen_rect)
+            pygame.draw.rect(screen, config.COLOR_BED, (x, y, self.rect.width, self.rect.height))
 
 # ----------------------------
 # MERCHANT
@@ -107,15 +212,20 @@ class Merchant(Interactable):
     def interact(self, player, game):
         game.active_menu = "merchant"
     
+    def tint(self, config):
+        """Fill color and alpha for this merchant from config"""
+        return config.COLOR_MERCHANT, config.ALPHA_MERCHANT
+
     def draw(self, screen, camera_x, camera_y, config):
         """Draw merchant with config colors"""
-        screen_rect = self.rect.move(-camera_x, -camera_y)
+        # int() truncates like Rect.move does, without allocating a Rect
+        x = self.rect.x - int(camera_x)
+        y = self.rect.y - int(camera_y)
         if config.ALPHA_MERCHANT < 255:
-            temp_surface = pygame.Surface((self.rect.width, self.rect.height), pygame.SRCALPHA)
-            temp_surface.fill((*config.COLOR_MERCHANT, config.ALPHA_MERCHANT))
-            screen.blit(temp_surface, screen_rect.topleft)
+            temp_surface = _get_tint_surface(self.rect.width, self.rect.height, config.COLOR_MERCHANT, config.ALPHA_MERCHANT)
+            screen.blit(temp_surface, (x, y))
         else:
-            pygame.draw.rect(screen, config.COLOR_MERCHANT, screen_rect)
+            pygame.draw.rect(screen, config.COLOR_MERCHANT, (x, y, self.rect.width, self.rect.height))
 
 # ----------------------------
 # WALL
@@ -132,29 +242,69 @@ class Wall(Interactable):
     
     def open_travel_menu(self, game):
         """Open the travel menu with available destinations"""
-        from Assets.Menus import TravelMenu
         destinations = [
-            (lvl.split("/")[-1].replace(".py", "").replace("_", " "), i)
-            for i, lvl in enumerate(game.level_files)
+            (name, i)
+            for i, name in enumerate(game.level_names)
             if i != game.current_level_index
         ]
         game.travel_menu = TravelMenu(game.font, destinations, game.settings)
         game.pause_player_physics()
         game.active_menu = "travel"
     
+    def tint(self, config):
+        """Fill color and alpha for this wall from config"""
+        return config.COLOR_WALL, config.ALPHA_WALL
+
     def draw(self, screen, camera_x, camera_y, config):
         """Draw wall with config colors"""
-        screen_rect = self.rect.move(-camera_x, -camera_y)
+        # int() truncates like Rect.move does, without allocating a Rect
+        x = self.rect.x - int(camera_x)
+        y = self.rect.y - int(camera_y)
         if config.ALPHA_WALL < 255:
-            temp_surface = pygame.Surface((self.rect.width, self.rect.height), pygame.SRCALPHA)
-            temp_surface.fill((*config.COLOR_WALL, config.ALPHA_WALL))
-            screen.blit(temp_surface, screen_rect.topleft)
+            temp_surface = _get_tint_surface(self.rect.width, self.rect.height, config.COLOR_WALL, config.ALPHA_WALL)
+            screen.blit(temp_surface, (x, y))
         else:
-            pygame.draw.rect(screen, config.COLOR_WALL, screen_rect)
+            pygame.draw.rect(screen, config.COLOR_WALL, (x, y, self.rect.width, self.rect.height))
 
 # ----------------------------
 # COIN (Animated)
 # ----------------------------
+@lru_cache(maxsize=8)
+def _load_coin_image(width, height):
+    """Load the static coin image scaled to size, or None if unavailable"""
+    try:
+        image = pygame.image.load("Assets/Photos/Coin.png")
+        return pygame.transform.scale(image, (width, height))
+    except:
+        return None
+
+
+@lru_cache(maxsize=8)
+def _load_coin_frames(width, height):
+    """Decode the coin GIF into scaled pygame frames (empty if unavailable)"""
+    frames = []
+    try:
+        # Try to load GIF frames (requires pillow)
+        gif = Image.open("Assets/Animations/Coin.gif")
+        try:
+            while True:
+                frame = gif.copy()
+                frame = frame.convert("RGBA")
+                # Convert PIL image to pygame surface
+                mode = frame.mode
+                size = frame.size
+                data = frame.tobytes()
+                pygame_image = pygame.image.fromstring(data, size, mode)
+                pygame_image = pygame.transform.scale(pygame_image, (width, height))
+                frames.append(pygame_image)
+                gif.seek(gif.tell() + 1)
+        except EOFError:
+            pass
+    except:
+        pass
+    return tuple(frames)
+
+
 class Coin:
     def __init__(self, x, y, width=32, height=32, gold_value=1):
         self.rect = pygame.Rect(x, y, width, height)
@@ -186,36 +336,11 @@ class Coin:
         self.animation_frame = 0
         self.animation_duration = 0.5  # Animation lasts 0.5 seconds
         
-        # Try to load coin image and animation
-        self.static_image = None
-        self.animation_frames = []
-        try:
-            self.static_image = pygame.image.load("Assets/Photos/Coin.png")
-            self.static_image = pygame.transform.scale(self.static_image, (width, height))
-        except:
-            pass
-        
-        try:
-            # Try to load GIF frames (requires pillow)
-            
-            gif = Image.open("Assets/Animations/Coin.gif")
-            self.animation_frames = []
-            try:
-                while True:
-                    frame = gif.copy()
-                    frame = frame.convert("RGBA")
-                    # Convert PIL image to pygame surface
-                    mode = frame.mode
-                    size = frame.size
-                    data = frame.tobytes()
-                    pygame_image = pygame.image.fromstring(data, size, mode)
-                    pygame_image = pygame.transform.scale(pygame_image, (width, height))
-                    self.animation_frames.append(pygame_image)
-                    gif.seek(gif.tell() + 1)
-            except EOFError:
-                pass
-        except:
-            pass
+        # Coin image and animation (decoded once per size, shared by all coins)
+        self.static_image = _load_coin_image(width, height)
+        self.animation_frames = _load_coin_frames(width, height)
+        self._nframes = len(self.animation_frames)
+        self._current_frame_index = 0  # Set by update(), read by draw()
         
         # Color fallback if no images
         self.color = (255, 215, 0)  # Gold color
@@ -238,25 +363,130 @@ class Coin:
             if self.animation_timer >= self.animation_interval:
                 self.is_animating = True
                 self.animation_frame = 0
+        
+        self._current_frame_index = min(int((self.animation_frame / self.animation_duration) * self._nframes),
+                                        self._nframes - 1)
     
     def draw(self, screen, camera_x, camera_y):
         """Draw the coin"""
-        screen_rect = self.rect.move(-camera_x, -camera_y)
+        # int() truncates like Rect.move does, without allocating a Rect
+        topleft = (self.rect.x - int(camera_x), self.rect.y - int(camera_y))
         
         if self.is_animating and self.animation_frames:
-            # Show animation
-            frame_index = int((self.animation_frame / self.animation_duration) * len(self.animation_frames))
-            frame_index = min(frame_index, len(self.animation_frames) - 1)
-            screen.blit(self.animation_frames[frame_index], screen_rect.topleft)
+            # Show animation (frame index computed in update)
+            screen.blit(self.animation_frames[self._current_frame_index], topleft)
         elif self.static_image:
             # Show static image
-            screen.blit(self.static_image, screen_rect.topleft)
+            screen.blit(self.static_image, topleft)
         else:
             # Fallback to colored rectangle
+            screen_rect = self.rect.move(-camera_x, -camera_y)
             pygame.draw.rect(screen, self.color, screen_rect)
             # Draw a simple coin symbol
             pygame.draw.circle(screen, (255, 255, 0), screen_rect.center, min(screen_rect.width, screen_rect.height) // 3)
 
+def update_coins(coins, dt):
+    """Advance bobbing and animation timers for many coins at once
+    
+    Same result as calling Coin.update(dt) on each coin, with the timer and
+    sine math done as array operations.
+    """
+    n = len(coins)
+    if n == 0:
+        return
+    
+    # Bobbing
+    bob_timer = np.fromiter((c.bob_timer for c in coins), float, n)
+    bob_timer += dt * np.fromiter((c.bob_speed for c in coins), float, n)
+    bob_y = np.fromiter((c.original_y for c in coins), float, n)
+    bob_y += np.sin(bob_timer) * np.fromiter((c.bob_height for c in coins), float, n)
+    
+    # Animation: animating coins advance their frame, idle ones their timer
+    animating = np.fromiter((c.is_animating for c in coins), bool, n)
+    frame = np.fromiter((c.animation_frame for c in coins), float, n)
+    timer = np.fromiter((c.animation_timer for c in coins), float, n)
+    frame[animating] += dt
+    timer[~animating] += dt
+    done = animating & (frame >= np.fromiter((c.animation_duration for c in coins), float, n))
+    start = ~animating & (timer >= np.fromiter((c.animation_interval for c in coins), float, n))
+    animating = (animating & ~done) | start
+    frame[done | start] = 0
+    timer[done] = 0
+    nframes = np.fromiter((c._nframes for c in coins), float, n)
+    index = (frame / np.fromiter((c.animation_duration for c in coins), float, n) * nframes).astype(np.int32)
+    index = np.minimum(index, nframes - 1).astype(np.int32)
+    
+    for coin, b, y, a, f, t, i in zip(coins, bob_timer.tolist(), bob_y.tolist(), animating.tolist(),
+                                      frame.tolist(), timer.tolist(), index.tolist()):
+        coin.bob_timer = b
+        coin.rect.y = y
+        coin.is_animating = a
+        coin.animation_frame = f
+        coin.animation_timer = t
+        coin._current_frame_index = i
+
+# ----------------------------
+# SLOPE MATH (shared by Tent and Rock)
+# ----------------------------
+def _slope_y(x, left_x, right_x, peak_x, peak_y, base_y):
+    """Height of a triangular slope's surface at x (base_y outside the slope)"""
+    if x <= left_x or x >= right_x:
+        return base_y
+    
+    if x <= peak_x:
+        slope_length = peak_x - left_x
+        if slope_length == 0:
+            return base_y
+        return base_y + (peak_y - base_y) * ((x - left_x) / slope_length)
+    
+    slope_length = right_x - peak_x
+    if slope_length == 0:
+        return base_y
+    return peak_y + (base_y - peak_y) * ((x - peak_x) / slope_length)
+
+
+def _is_on_slope(center_x, bottom, y_momentum, left_x, right_x, peak_x, peak_y, base_y):
+    """Whether a body with this bottom-center point is standing on the slope"""
+    if center_x < left_x - 5 or center_x > right_x + 5:
+        return False
+    
+    if bottom < peak_y - 10 or bottom > base_y + 15:
+        return False
+    
+    surface_y = _slope_y(center_x, left_x, right_x, peak_x, peak_y, base_y)
+    return abs(bottom - surface_y) < 25 and y_momentum >= -2
+
+
+def slope_geometry(slopes):
+    """Pack Tent/Rock geometry into an (N, 5) array of left, right, peak_x, peak_y, base_y"""
+    return np.array([s.slope_params for s in slopes], dtype=float).reshape(-1, 5)
+
+
+def first_slope_under(geometry, center_x, bottom, y_momentum):
+    """Index of the first slope a body is standing on, or -1
+    
+    Vectorized _is_on_slope over every row of a slope_geometry() array.
+    """
+    if y_momentum < -2 or len(geometry) == 0:
+        return -1
+    left, right, peak_x, peak_y, base_y = geometry.T
+    
+    candidates = ((center_x >= left - 5) & (center_x <= right + 5) &
+                  (bottom >= peak_y - 10) & (bottom <= base_y + 15))
+    if not candidates.any():
+        return -1
+    
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rising = base_y + (peak_y - base_y) * ((center_x - left) / (peak_x - left))
+        falling = peak_y + (base_y - peak_y) * ((center_x - peak_x) / (right - peak_x))
+    surface_y = np.where(center_x <= peak_x,
+                         np.where(peak_x == left, base_y, rising),
+                         np.where(right == peak_x, base_y, falling))
+    surface_y = np.where((center_x <= left) | (center_x >= right), base_y, surface_y)
+    
+    on_slope = candidates & (np.abs(bottom - surface_y) < 25)
+    return int(on_slope.argmax()) if on_slope.any() else -1
+
 # ----------------------------
 # TENT (Large Sloped Polygon)
 # ----------------------------
@@ -275,41 +505,14 @@ class Tent:
         self.left_x = x
         self.right_x = x + self.width
         self.base_y = y - 20
+        # Packed once for the slope helpers (tents/rocks never move)
+        self.slope_params = (self.left_x, self.right_x, self.peak_x, self.peak_y, self.base_y)
     
     def is_player_on_tent(self, player):
-        player_center_x = player.rect.centerx
-        player_bottom = player.rect.bottom
-        
-        if player_center_x < self.left_x - 5 or player_center_x > self.right_x + 5:
-            return False
-        
-        if player_bottom < self.peak_y - 10 or player_bottom > self.base_y + 15:
-            return False
-        
-        tent_y = self.get_tent_y_at_x(player_center_x)
-        
-        return abs(player_bottom - tent_y) < 25 and player.y_momentum >= -2
+        return _is_on_slope(player.rect.centerx, player.rect.bottom, player.y_momentum, *self.slope_params)
     
     def get_tent_y_at_x(self, player_x):
-        if player_x <= self.left_x:
-            return self.base_y
-        if player_x >= self.right_x:
-            return self.base_y
-        
-        if player_x <= self.peak_x:
-            slope_length = self.peak_x - self.left_x
-            if slope_length == 0:
-                return self.base_y
-            progress = (player_x - self.left_x) / slope_length
-            y_on_slope = self.base_y + (self.peak_y - self.base_y) * progress
-        else:
-            slope_length = self.right_x - self.peak_x
-            if slope_length == 0:
-                return self.base_y
-            progress = (player_x - self.peak_x) / slope_length
-            y_on_slope = self.peak_y + (self.base_y - self.peak_y) * progress
-        
-        return y_on_slope
+        return _slope_y(player_x, *self.slope_params)
     
     def handle_tent_collision(self, player):
         """Make player slide down the tent naturally"""
@@ -359,33 +562,23 @@ class Tent:
         base_rect = pygame.Rect(self.x - camera_x, self.y - camera_y - 20, self.width, 20)
         
         if config.ALPHA_TENT < 255:
-            base_surface = pygame.Surface((self.width, 20), pygame.SRCALPHA)
-            base_surface.fill((*config.COLOR_TENT_BASE, config.ALPHA_TENT))
+            base_surface = _get_tint_surface(self.width, 20, config.COLOR_TENT_BASE, config.ALPHA_TENT)
             screen.blit(base_surface, base_rect.topleft)
         else:
             pygame.draw.rect(screen, config.COLOR_TENT_BASE, base_rect)
         
         # Tent triangle
-        points = [
-            (self.x - camera_x, self.y - camera_y - 20),
-            (self.peak_x - camera_x, self.peak_y - camera_y),
-            (self.right_x - camera_x, self.y - camera_y - 20)
-        ]
-        
         if config.ALPHA_TENT < 255:
-            # Draw on temporary surface for alpha
-            tent_surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-            local_points = [
-                (0, self.height - 20),
-                (self.width // 2, 0),
-                (self.width, self.height - 20)
-            ]
-            pygame.draw.polygon(tent_surface, (*config.COLOR_TENT, config.ALPHA_TENT), local_points)
-            pygame.draw.polygon(tent_surface, (*config.COLOR_TENT_OUTLINE, config.ALPHA_TENT), local_points, 3)
+            # Pre-rendered translucent triangle (shared by all tents with these colors)
+            tent_surface = _get_triangle_surface(self.width, self.height, self.height - 20, config.COLOR_TENT,
+                                                 config.COLOR_TENT_OUTLINE, config.ALPHA_TENT)
             screen.blit(tent_surface, (self.x - camera_x, self.peak_y - camera_y))
         else:
-            pygame.draw.polygon(screen, config.COLOR_TENT, points)
-            pygame.draw.polygon(screen, config.COLOR_TENT_OUTLINE, points, 3)
+            # Opaque triangle pre-rendered once; padded so the 3px outline isn't clipped
+            tent_surface = _get_triangle_surface(self.width, self.height, self.height - 20, config.COLOR_TENT,
+                                                 config.COLOR_TENT_OUTLINE, 255, _OUTLINE_PAD)
+            screen.blit(tent_surface, (math.floor(self.x - camera_x) - _OUTLINE_PAD,
+                                       math.floor(self.peak_y - camera_y) - _OUTLINE_PAD))
 
 # ----------------------------
 # ROCK (Small Sloped Polygon)
@@ -405,45 +598,18 @@ class Rock:
         self.left_x = x
         self.right_x = x + self.width
         self.base_y = y
+        # Packed once for the slope helpers (tents/rocks never move)
+        self.slope_params = (self.left_x, self.right_x, self.peak_x, self.peak_y, self.base_y)
     
     def is_player_on_rock(self, player):
-        player_center_x = player.rect.centerx
-        player_bottom = player.rect.bottom
-        
-        if player_center_x < self.left_x - 5 or player_center_x > self.right_x + 5:
-            return False
-        
-        if player_bottom < self.peak_y - 10 or player_bottom > self.base_y + 15:
-            return False
-        
-        rock_y = self.get_rock_y_at_x(player_center_x)
-        
-        return abs(player_bottom - rock_y) < 25 and player.y_momentum >= -2
+        return _is_on_slope(player.rect.centerx, player.rect.bottom, player.y_momentum, *self.slope_params)
     
     def get_collision_rect(self):
         """Return the base rectangle for collision"""
         return pygame.Rect(self.x, self.base_y - 10, self.width, 10)
     
     def get_rock_y_at_x(self, player_x):
-        if player_x <= self.left_x:
-            return self.base_y
-        if player_x >= self.right_x:
-            return self.base_y
-        
-        if player_x <= self.peak_x:
-            slope_length = self.peak_x - self.left_x
-            if slope_length == 0:
-                return self.base_y
-            progress = (player_x - self.left_x) / slope_length
-            y_on_slope = self.base_y + (self.peak_y - self.base_y) * progress
-        else:
-            slope_length = self.right_x - self.peak_x
-            if slope_length == 0:
-                return self.base_y
-            progress = (player_x - self.peak_x) / slope_length
-            y_on_slope = self.peak_y + (self.base_y - self.peak_y) * progress
-        
-        return y_on_slope
+        return _slope_y(player_x, *self.slope_params)
     
     def handle_rock_collision(self, player):
         """Handle player on rock - place on surface and allow sliding"""
@@ -467,23 +633,14 @@ class Rock:
         return True
     
     def draw(self, screen, camera_x, camera_y, config):
-        points = [
-            (self.x - camera_x, self.base_y - camera_y),
-            (self.peak_x - camera_x, self.peak_y - camera_y),
-            (self.right_x - camera_x, self.base_y - camera_y)
-        ]
-        
         if config.ALPHA_ROCK < 255:
-            # Draw on temporary surface for alpha
-            rock_surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-            local_points = [
-                (0, self.height),
-                (self.width // 2, 0),
-                (self.width, self.height)
-            ]
-            pygame.draw.polygon(rock_surface, (*config.COLOR_ROCK, config.ALPHA_ROCK), local_points)
-            pygame.draw.polygon(rock_surface, (*config.COLOR_ROCK_OUTLINE, config.ALPHA_ROCK), local_points, 3)
+            # Pre-rendered translucent triangle (shared by all rocks with these colors)
+            rock_surface = _get_triangle_surface(self.width, self.height, self.height, config.COLOR_ROCK,
+                                                 config.COLOR_ROCK_OUTLINE, config.ALPHA_ROCK)
             screen.blit(rock_surface, (self.x - camera_x, self.peak_y - camera_y))
         else:
-            pygame.draw.polygon(screen, config.COLOR_ROCK, points)
-            pygame.draw.polygon(screen, config.COLOR_ROCK_OUTLINE, points, 3)
\ No newline at end of file
+            # Opaque triangle pre-rendered once; padded so the 3px outline isn't clipped
+            rock_surface = _get_triangle_surface(self.width, self.height, self.height, config.COLOR_ROCK,
+                                                 config.COLOR_ROCK_OUTLINE, 255, _OUTLINE_PAD)
+            screen.blit(rock_surface, (math.floor(self.x - camera_x) - _OUTLINE_PAD,
+                                       math.floor(self.peak_y - camera_y) - _OUTLINE_PAD))
\ No newline at end of file
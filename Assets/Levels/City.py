@@ -2,48 +2,42 @@ import pygame
 from Assets.Interactables import Merchant
 from Assets.Interactables import Wall
 
-def load_level():
-    # Background-aligned metrics
-    bg_width = 1024
-    bg_height = 863
-    ground_height = 32
-    ground_y = 815  # Align with visible street/floor in city.jpg
-
+# Background-aligned metrics
+BG_WIDTH = 1024
+BG_HEIGHT = 863
+GROUND_HEIGHT = 32
+GROUND_Y = 815  # Align with visible street/floor in city.jpg
+
+# Nothing in the city keeps state, so the room is built once at import and
+# load_level() hands out fresh lists over the same objects
+_TEMPLATE = {
     # Floor aligned to background bottom
-    ground = [pygame.Rect(0, ground_y, bg_width, ground_height)]
+    "ground": [pygame.Rect(0, GROUND_Y, BG_WIDTH, GROUND_HEIGHT)],
     # Add a small ledge/platform on the left building
-    platforms = [pygame.Rect(120, 640, 220, 24)]
-
-    # No platforms
-    # (platforms defined above)
-
+    "platforms": [pygame.Rect(120, 640, 220, 24)],
     # NPCs
-    npcs = []
-
+    "npcs": [],
     # Interactables (merchant)
-    interactables = [
-        Merchant(x=500, y=ground_y - 64),  # Place on ground
-        Wall(0, 0, 40, ground_y, destination_index=True),   # left wall triggers menu
-        Wall(bg_width - 40, 0, 40, ground_y, destination_index=True) # right wall triggers menu
-    ]
-
+    "interactables": [
+        Merchant(x=500, y=GROUND_Y - 64),  # Place on ground
+        Wall(0, 0, 40, GROUND_Y, destination_index=True),   # left wall triggers menu
+        Wall(BG_WIDTH - 40, 0, 40, GROUND_Y, destination_index=True) # right wall triggers menu
+    ],
+    "coins": [],  # No coins in city
+    "enemies": [],  # No enemies in city
     # Player start
-    player_start = (100, ground_y - 64)
+    "player_start": (100, GROUND_Y - 64),
+    "infinite": False,
+    "world_width": BG_WIDTH,
+    "world_height": BG_HEIGHT,
+    "level_id": "city",
+    "music_category": "city"
+}
 
-    # No enemies in city
-    enemies = []
 
-    return {
-        "ground": ground,
-        "platforms": platforms,
-        "npcs": npcs,
-        "interactables": interactables,
-        "coins": [],  # No coins in city
-        "enemies": enemies,
-        "player_start": player_start,
-        "infinite": False,
-        "world_width": bg_width,
-        "world_height": bg_height,
-        "level_id": "city",
-        "music_category": "city"
-    }
\ No newline at end of file
+def load_level():
+    # The game filters/extends these lists, so each load gets its own copies
+    level = dict(_TEMPLATE)
+    for key in ("ground", "platforms", "npcs", "interactables", "coins", "enemies"):
+        level[key] = list(_TEMPLATE[key])
+    return level
@@ -1,5 +1,5 @@
 import pygame
-import random
+import numpy as np
 from Assets.Interactables import Wall, Merchant, Tent, Rock
 from Assets.Characters import SmallBandit, LargeBandit
 
@@ -20,47 +20,180 @@ ENEMY_CHANCE = 0.1      # 10% chance per segment to spawn enemy group
 # Platform density configuration
 MAX_PLATFORMS_PER_SEGMENT = 1  # Adjust this for fewer/more platforms
 
+# Enemy group size
+ENEMY_GROUP_MIN = 2
+ENEMY_GROUP_MAX = 4
 
-def load_level():
-    # INTERACTABLE WALL
-    wall = Wall(
-        x=-40,
-        y=0,
-        width=40,
-        height=SCREEN_HEIGHT,
-        destination_index=True
-    )
-
-    ground = []
-    platforms = []
-    npcs = []
-    interactables = [wall]
-    natural_objects = []  # Tents and rocks
-    tents = []
-    rocks = []
-    coins = []  # No coins in Dark Forest
-    enemies = []  # Enemy list
+# Random draws: every decision a segment makes reads one row of uniform
+# [0, 1) floats, and rows are drawn from NumPy in bulk
+SEGMENT_ROLL_BATCH = 64  # Rows per NumPy draw
+_ROLL_FIXED = 11  # Height, platform count, merchant/tent/rock/enemy rolls
+_ROLL_PLATFORM = 3  # Width, x, y per platform
+_ROLL_ENEMY = 2  # x, type per enemy
+_ROLLS_PER_SEGMENT = _ROLL_FIXED + _ROLL_PLATFORM * MAX_PLATFORMS_PER_SEGMENT + _ROLL_ENEMY * ENEMY_GROUP_MAX
+_rng = np.random.default_rng()
+_roll_rows = []
+
+
+def _segment_rolls():
+    """A fresh row of uniform floats for one segment"""
+    if not _roll_rows:
+        _roll_rows.extend(_rng.random((SEGMENT_ROLL_BATCH, _ROLLS_PER_SEGMENT)).tolist())
+    return _roll_rows.pop()
+
+
+def _randint(u, a, b):
+    """Map a uniform draw u in [0, 1) to an int in [a, b] (inclusive, like randint)"""
+    return a + int(u * (b - a + 1))
+
+# Evicted bandits are kept (up to this many per class) and reused by new segments
+ENEMY_POOL_SIZE = 32
+_small_pool = []
+_large_pool = []
+
+
+def _acquire(pool, enemy_class, x, y):
+    if pool:
+        enemy = pool.pop()
+        enemy.reset(x, y)
+        return enemy
+    return enemy_class(x, y)
+
+
+def acquire_small(x, y):
+    """A SmallBandit at (x, y), reused from the pool when one is free"""
+    return _acquire(_small_pool, SmallBandit, x, y)
+
+
+def acquire_large(x, y):
+    """A LargeBandit at (x, y), reused from the pool when one is free"""
+    return _acquire(_large_pool, LargeBandit, x, y)
 
+
+def release(enemy):
+    """Hand an enemy that is no longer referenced by the level back to its pool
+    
+    Pooled enemies get reset() and moved by the next acquire, so only release
+    ones that are dead or out of range and already off level["enemies"].
+    """
+    pool = {SmallBandit: _small_pool, LargeBandit: _large_pool}.get(type(enemy))
+    if pool is None or len(pool) >= ENEMY_POOL_SIZE:
+        return
+    if any(pooled is enemy for pooled in pool):
+        return  # Already pooled; a second entry would hand it out twice
+    pool.append(enemy)
+
+
+class SpatialHash:
+    """Uniform grid over rects (or objects with a .rect) for local overlap queries
+    
+    Each item is bucketed into every cell its rect touches, so a query only
+    looks at the few cells under the query rect instead of the whole world.
+    """
+    def __init__(self, cell_size=SEGMENT_WIDTH):
+        self.cell_size = cell_size
+        self.cells = {}   # (cell_x, cell_y) -> list of items
+        self._order = {}  # id(item) -> insertion number, so queries keep insertion order
+        self._next = 0
+    
+    @staticmethod
+    def _rect(item):
+        return item if isinstance(item, pygame.Rect) else item.rect
+    
+    def _cells_for(self, rect):
+        size = self.cell_size
+        for cx in range(rect.left // size, (rect.right - 1) // size + 1):
+            for cy in range(rect.top // size, (rect.bottom - 1) // size + 1):
+                yield (cx, cy)
+    
+    def __len__(self):
+        return len(self._order)
+    
+    def insert(self, item):
+        self._order[id(item)] = self._next
+        self._next += 1
+        for cell in self._cells_for(self._rect(item)):
+            self.cells.setdefault(cell, []).append(item)
+    
+    def remove(self, item):
+        """Remove an item (by identity); unknown items are ignored"""
+        if self._order.pop(id(item), None) is None:
+            return
+        for cell in self._cells_for(self._rect(item)):
+            bucket = self.cells.get(cell)
+            if bucket is None:
+                continue
+            bucket[:] = [o for o in bucket if o is not item]
+            if not bucket:
+                del self.cells[cell]
+    
+    def query(self, rect):
+        """Items whose rect overlaps rect (Rect.colliderect), in insertion order"""
+        found = {}
+        for cell in self._cells_for(rect):
+            bucket = self.cells.get(cell)
+            if bucket:
+                for i in rect.collidelistall(bucket):
+                    found[id(bucket[i])] = bucket[i]
+        return [found[key] for key in sorted(found, key=self._order.__getitem__)]
+    
+    def collides(self, rect):
+        """True if any item overlaps rect; stops at the first hit"""
+        for cell in self._cells_for(rect):
+            bucket = self.cells.get(cell)
+            if bucket and rect.collidelist(bucket) != -1:
+                return True
+        return False
+
+
+# INTERACTABLE WALL (menu trigger left of spawn; stateless, so shared by every load)
+_WALL = Wall(
+    x=-40,
+    y=0,
+    width=40,
+    height=SCREEN_HEIGHT,
+    destination_index=True
+)
+
+
+def load_level():
     segments = {}
+    terrain = SpatialHash()  # Ground and platform rects, bucketed by cell
+    ground_heights = {}  # index -> ground y of every segment made, so evicted ones come back level
+
+    # Live lists are read through this dict: eviction and the game's spawn
+    # pruning replace them, and generate_segment must extend the current ones
+    level = {
+        "ground": [],
+        "platforms": [],
+        "segments": segments,
+        "spatial_hash": terrain,
+        "npcs": [],
+        "interactables": [_WALL],
+        "natural_objects": [],  # Tents and rocks
+        "tents": [],
+        "rocks": [],
+        "coins": [],  # No coins in Dark Forest
+        "enemies": [],  # Enemy list
+        "infinite": True,
+        "level_id": "dark_forest",
+        "music_category": "dark_forest"
+    }
 
     current_ground_y = SCREEN_HEIGHT - 64
     distance_since_change = 0
-    next_height_change = random.randint(
-        HEIGHT_CHANGE_MIN,
-        HEIGHT_CHANGE_MAX
-    )
+    next_height_change = int(_rng.integers(HEIGHT_CHANGE_MIN, HEIGHT_CHANGE_MAX + 1))
 
     # Merchant tracking
     last_merchant_segment = -1000
 
     # --- Helper function to prevent tent spawning under platforms ---
-    def platform_above_x(segment_platforms, x, width, ground_y):
-        # Tent rect extending upwards to check for overlap
-        tent_rect = pygame.Rect(x, ground_y - 400, width, 400)
-        for p in segment_platforms:
-            if p.colliderect(tent_rect):
-                return True
-        return False
+    tent_rect = pygame.Rect(0, 0, 0, 400)  # Reused probe, moved per check
+
+    def platform_above_x(x, width, ground_y):
+        # Tent rect extending upwards to check for overlap (ground starts at its bottom edge)
+        tent_rect.x, tent_rect.y, tent_rect.width = x, ground_y - 400, width
+        return terrain.collides(tent_rect)
 
     # --- Segment generation ---
     def generate_segment(index):
@@ -70,50 +203,67 @@ def load_level():
             return
 
         segment_x = index * SEGMENT_WIDTH
-        distance_since_change += SEGMENT_WIDTH
-
-        # Change height every 2000-3000 px
-        if distance_since_change >= next_height_change:
-            current_ground_y += random.choice([-GROUND_STEP, GROUND_STEP])
-            current_ground_y = max(
-                300,
-                min(current_ground_y, SCREEN_HEIGHT - 64)
-            )
-            distance_since_change = 0
-            next_height_change = random.randint(
-                HEIGHT_CHANGE_MIN,
-                HEIGHT_CHANGE_MAX
-            )
+        rolls = _segment_rolls()
+        (height_step, height_next, platform_roll, merchant_roll, merchant_pos, tent_roll, tent_pos,
+         rock_roll, rock_pos, enemy_roll, enemy_count_roll) = rolls[:_ROLL_FIXED]
+        platform_rolls = rolls[_ROLL_FIXED:_ROLL_FIXED + _ROLL_PLATFORM * MAX_PLATFORMS_PER_SEGMENT]
+        enemy_rolls = rolls[_ROLL_FIXED + _ROLL_PLATFORM * MAX_PLATFORMS_PER_SEGMENT:]
+
+        if index in ground_heights:
+            # Coming back to an evicted segment: same ground, freshly rolled contents
+            ground_y = ground_heights[index]
+        else:
+            distance_since_change += SEGMENT_WIDTH
+
+            # Change height every 2000-3000 px
+            if distance_since_change >= next_height_change:
+                current_ground_y += -GROUND_STEP if height_step < 0.5 else GROUND_STEP
+                current_ground_y = max(
+                    300,
+                    min(current_ground_y, SCREEN_HEIGHT - 64)
+                )
+                distance_since_change = 0
+                next_height_change = _randint(
+                    height_next,
+                    HEIGHT_CHANGE_MIN,
+                    HEIGHT_CHANGE_MAX
+                )
+            ground_y = ground_heights[index] = current_ground_y
 
         # Ground fills to bottom of screen
         ground_rect = pygame.Rect(
             segment_x,
-            current_ground_y,
+            ground_y,
             SEGMENT_WIDTH,
-            SCREEN_HEIGHT - current_ground_y
+            SCREEN_HEIGHT - ground_y
         )
 
         # Generate platforms (Option 2: controlled density)
         segment_platforms = []
         if index != 0:  # Keep spawn segment empty of platforms
-            platform_count = random.randint(0, MAX_PLATFORMS_PER_SEGMENT)
+            platform_count = _randint(platform_roll, 0, MAX_PLATFORMS_PER_SEGMENT)
 
-            for _ in range(platform_count):
+            for n in range(platform_count):
+                w_roll, x_roll, y_roll = platform_rolls[_ROLL_PLATFORM * n:_ROLL_PLATFORM * (n + 1)]
                 # maximum width the platform can have given the margins
                 max_platform_width = SEGMENT_WIDTH - 200 - 200
                 if max_platform_width < 200:
                     break  # cannot place any platform in this segment
 
-                w = random.randint(200, min(400, max_platform_width))
+                w = _randint(w_roll, 200, min(400, max_platform_width))
                 x_min = 200
                 x_max = SEGMENT_WIDTH - w - 200
 
                 if x_max >= x_min:
-                    x = segment_x + random.randint(x_min, x_max)
-                    y = current_ground_y - random.randint(220, 320)
+                    x = segment_x + _randint(x_roll, x_min, x_max)
+                    y = ground_y - _randint(y_roll, 220, 320)
                     segment_platforms.append(pygame.Rect(x, y, w, 16))
                 # if x_max < x_min, skip this platform
 
+        terrain.insert(ground_rect)
+        for p in segment_platforms:
+            terrain.insert(p)
+
         # Generate natural occurrences
         segment_natural = []
         segment_tents = []
@@ -123,41 +273,42 @@ def load_level():
         if index != 0:  # No spawns in the spawn segment
             # MERCHANT - Rare spawn with cooldown
             if (index - last_merchant_segment) >= MERCHANT_COOLDOWN:
-                if random.random() < MERCHANT_CHANCE:
-                    merchant_x = segment_x + random.randint(200, SEGMENT_WIDTH - 200)
-                    merchant = Merchant(merchant_x, current_ground_y - 48)
+                if merchant_roll < MERCHANT_CHANCE:
+                    merchant_x = segment_x + _randint(merchant_pos, 200, SEGMENT_WIDTH - 200)
+                    merchant = Merchant(merchant_x, ground_y - 48)
                     segment_interactables.append(merchant)
                     last_merchant_segment = index
 
             # TENTS - Large sloped polygons (must NOT spawn under platforms)
-            if random.random() < TENT_CHANCE:
-                tent_x = segment_x + random.randint(150, SEGMENT_WIDTH - 350)
+            if tent_roll < TENT_CHANCE:
+                tent_x = segment_x + _randint(tent_pos, 150, SEGMENT_WIDTH - 350)
                 tent_width = 200  # adjust to Tent actual width if needed
-                if not platform_above_x(segment_platforms, tent_x, tent_width, current_ground_y):
-                    tent = Tent(tent_x, current_ground_y)
+                if not platform_above_x(tent_x, tent_width, ground_y):
+                    tent = Tent(tent_x, ground_y)
                     segment_tents.append(tent)
                     segment_natural.append(tent)
                     segment_interactables.append(tent)
 
             # ROCKS - Small sloped polygons
-            if random.random() < ROCK_CHANCE:
-                rock_x = segment_x + random.randint(100, SEGMENT_WIDTH - 200)
-                rock = Rock(rock_x, current_ground_y)
+            if rock_roll < ROCK_CHANCE:
+                rock_x = segment_x + _randint(rock_pos, 100, SEGMENT_WIDTH - 200)
+                rock = Rock(rock_x, ground_y)
                 segment_rocks.append(rock)
                 segment_natural.append(rock)
         
         # ENEMIES - Spawn groups of 2-4 bandits
         segment_enemies = []
-        if index != 0 and random.random() < ENEMY_CHANCE:
-            num_enemies = random.randint(2, 4)
+        if index != 0 and enemy_roll < ENEMY_CHANCE:
+            num_enemies = _randint(enemy_count_roll, ENEMY_GROUP_MIN, ENEMY_GROUP_MAX)
             for i in range(num_enemies):
-                enemy_x = segment_x + random.randint(150, SEGMENT_WIDTH - 150)
-                enemy_y = current_ground_y
+                x_roll, type_roll = enemy_rolls[_ROLL_ENEMY * i:_ROLL_ENEMY * (i + 1)]
+                enemy_x = segment_x + _randint(x_roll, 150, SEGMENT_WIDTH - 150)
+                enemy_y = ground_y
                 # More large bandits in the Dark Forest (50/50 split)
-                if random.random() < 0.5:
-                    segment_enemies.append(SmallBandit(enemy_x, enemy_y))
+                if type_roll < 0.5:
+                    segment_enemies.append(acquire_small(enemy_x, enemy_y))
                 else:
-                    segment_enemies.append(LargeBandit(enemy_x, enemy_y))
+                    segment_enemies.append(acquire_large(enemy_x, enemy_y))
 
         # Save segment data
         segments[index] = {
@@ -171,34 +322,61 @@ def load_level():
         }
 
         # Extend global lists
-        ground.append(ground_rect)
-        platforms.extend(segment_platforms)
-        natural_objects.extend(segment_natural)
-        tents.extend(segment_tents)
-        rocks.extend(segment_rocks)
-        interactables.extend(segment_interactables)
-        enemies.extend(segment_enemies)
+        level["ground"].append(ground_rect)
+        level["platforms"].extend(segment_platforms)
+        level["natural_objects"].extend(segment_natural)
+        level["tents"].extend(segment_tents)
+        level["rocks"].extend(segment_rocks)
+        level["interactables"].extend(segment_interactables)
+        level["enemies"].extend(segment_enemies)
+
+    # --- Segment eviction ---
+    def evict_segment(index, center, keep_distance):
+        """Drop a far-away segment and everything it spawned from the live lists
+        
+        The lists are replaced rather than edited in place, so anything caching
+        them by identity sees the change. generate_segment(index) rebuilds it.
+        
+        Enemies go by where they are now, not where they spawned: a live one
+        standing within keep_distance segments of center (say, one that chased
+        the player) stays in play and moves to the remaining segment nearest it.
+        """
+        seg = segments.pop(index, None)
+        if seg is None:
+            return
+
+        terrain.remove(seg["ground"])
+        for p in seg["platforms"]:
+            terrain.remove(p)
+
+        evicted_enemies = []
+        for enemy in seg["enemies"]:
+            enemy_seg = enemy.rect.centerx // SEGMENT_WIDTH
+            if enemy.is_alive() and abs(enemy_seg - center) <= keep_distance and segments:
+                nearest = min(segments, key=lambda i: abs(i - enemy_seg))
+                segments[nearest]["enemies"].append(enemy)
+            else:
+                evicted_enemies.append(enemy)
+        seg["enemies"] = evicted_enemies
+
+        level["ground"] = [g for g in level["ground"] if g is not seg["ground"]]
+        for key in ("platforms", "natural_objects", "tents", "rocks", "interactables", "enemies"):
+            if seg[key]:
+                dropped = {id(o) for o in seg[key]}
+                level[key] = [o for o in level[key] if id(o) not in dropped]
+        # Never pool an enemy the level still holds, or acquire would reset it in play
+        live = {id(e) for e in level["enemies"]}
+        for enemy in evicted_enemies:
+            if id(enemy) not in live:
+                release(enemy)
+
+    level["generate_segment"] = generate_segment
+    level["evict_segment"] = evict_segment
 
     # Pre-generate starting area
     for i in range(-4, 6):
         generate_segment(i)
 
-    player_start = (200, current_ground_y - 64)
+    level["player_start"] = (200, current_ground_y - 64)
 
-    return {
-        "ground": ground,
-        "platforms": platforms,
-        "segments": segments,
-        "generate_segment": generate_segment,
-        "npcs": npcs,
-        "interactables": interactables,
-        "natural_objects": natural_objects,
-        "tents": tents,
-        "rocks": rocks,
-        "coins": coins,
-        "enemies": enemies,
-        "player_start": player_start,
-        "infinite": True,
-        "level_id": "dark_forest",
-        "music_category": "dark_forest"
-    }
\ No newline at end of file
+    return level
\ No newline at end of file
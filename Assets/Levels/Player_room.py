@@ -1,14 +1,21 @@
 import pygame
 from Assets.Interactables import Wall, Bed, Coin
 
+# Terrain and walls never change, so they are built once at import
+_GROUND = [pygame.Rect(0, 920-64, 1080, 64)]
+_WALLS = [
+    Wall(0, 0, 40, 856, destination_index=True),   # left wall triggers menu
+    Wall(1040, 0, 40, 856, destination_index=True) # right wall triggers menu
+]
+
+
 def load_level():
-    ground = [pygame.Rect(0, 920-64, 1080, 64)]
+    ground = list(_GROUND)
     platforms = []
     npcs = []
     interactables = [
-        Bed(400, 920-32-64),          # Bed: collidable
-        Wall(0, 0, 40, 856, destination_index=True),   # left wall triggers menu
-        Wall(1040, 0, 40, 856, destination_index=True) # right wall triggers menu
+        Bed(400, 920-32-64),          # Bed: collidable (keeps rest/fade state, so built per load)
+        *_WALLS
     ]
     
     # Add coin that animates every 5 seconds
@@ -33,4 +40,4 @@ def load_level():
         "world_width": 1080,
         "level_id": "player_room",
         "music_category": "player_room"
-    }
\ No newline at end of file
+    }
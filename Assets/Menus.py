@@ -1,17 +1,36 @@
 # Assets/Menus.py
 import pygame
 import os
+from functools import lru_cache
 
 # Global font helper: use Cavalhatriz if available
 CAVALHATRIZ_PATH = os.path.join("Assets", "Fonts", "Cavalhatriz.ttf")
 
+@lru_cache(maxsize=None)
 def get_font(size):
     return pygame.font.Font(CAVALHATRIZ_PATH if os.path.exists(CAVALHATRIZ_PATH) else None, size)
 
+# Rendered antialiased text keyed by (font, text, color); menus redraw the same labels every frame
+_TEXT_CACHE = {}
+_TEXT_CACHE_MAX = 512  # Dropped wholesale when full (stat readouts and such keep changing)
+
+def render_text(font, text, color):
+    """font.render(text, True, color), cached across frames"""
+    key = (font, text, color)
+    surface = _TEXT_CACHE.get(key)
+    if surface is None:
+        if len(_TEXT_CACHE) >= _TEXT_CACHE_MAX:
+            _TEXT_CACHE.clear()
+        surface = _TEXT_CACHE[key] = font.render(text, True, color)
+    return surface
+
 # ----------------------------
 # BASE MENU
 # ----------------------------
 class BaseMenu:
+    __slots__ = ("options", "selected", "font", "settings", "surface", "rect", "_drawn_state")
+    BACK_ACTION = "close"  # Returned when the Pause/back key is pressed
+
     def __init__(self, options, font, settings=None, width=400, height=250):
         self.options = options
         self.selected = 0
@@ -19,6 +38,7 @@ class BaseMenu:
         self.settings = settings
         self.surface = pygame.Surface((width, height))
         self.rect = self.surface.get_rect()
+        self._drawn_state = None  # (selected, options) the surface was last drawn with
 
     def handle_input(self, event):
         if event.type != pygame.KEYDOWN:
@@ -35,30 +55,35 @@ class BaseMenu:
         elif event.key in select_keys:
             return self.options[self.selected][1]
         elif event.key == back:
-            return "close"
+            return self.BACK_ACTION
 
     def draw(self, screen):
-        self.surface.fill((40, 40, 40))
-        for i, (text, _) in enumerate(self.options):
-            color = (255, 255, 0) if i == self.selected else (255, 255, 255)
-            txt = self.font.render(text, True, color)
-            self.surface.blit(txt, (40, 40 + i * 40))
+        # Redraw the panel only when the selection or options change
+        state = (self.selected, tuple(self.options))
+        if state != self._drawn_state:
+            self.surface.fill((40, 40, 40))
+            self.surface.blits([
+                (render_text(self.font, text, (255, 255, 0) if i == self.selected else (255, 255, 255)),
+                 (40, 40 + i * 40))
+                for i, (text, _) in enumerate(self.options)
+            ], doreturn=False)
+            self._drawn_state = state
         screen.blit(self.surface, self.rect.topleft)
 
 # ----------------------------
 # START MENU
 # ----------------------------
-class StartMenu:
+class StartMenu(BaseMenu):
+    __slots__ = ("background_image", "title_image", "_scaled_bg", "_scaled_size")
+    BACK_ACTION = "quit"  # Escape/Back quits game
+
     def __init__(self, font, settings=None):
-        self.font = font
-        self.settings = settings
+        options = [("New Game", "start"), ("Options", "settings"), ("Quit", "quit")]
         # Check if save file exists
         save_exists = os.path.exists("save_data.json")
         if save_exists:
-            self.options = ["Continue", "New Game", "Options", "Quit"]
-        else:
-            self.options = ["New Game", "Options", "Quit"]
-        self.selected = 0
+            options.insert(0, ("Continue", "continue"))
+        super().__init__(options, font, settings)
         
         # Try to load background and title images
         self.background_image = None
@@ -79,68 +104,56 @@ class StartMenu:
         except:
             # Use text title if image not found
             self.title_image = None
-
-    def handle_input(self, event):
-        if event.type == pygame.KEYDOWN:
-            kb = self.settings.keybinds if self.settings else {}
-            up = kb.get("Jump", pygame.K_w)
-            down = kb.get("MoveDown", pygame.K_s)
-            select_keys = {kb.get("Interact", pygame.K_e), pygame.K_RETURN}
-            back = kb.get("Pause", pygame.K_ESCAPE)
-            
-            if event.key == up:
-                self.selected = (self.selected - 1) % len(self.options)
-            elif event.key == down:
-                self.selected = (self.selected + 1) % len(self.options)
-            elif event.key in select_keys:
-                option = self.options[self.selected]
-                if option == "Continue":
-                    return "continue"
-                elif option == "New Game":
-                    return "start"
-                elif option == "Options":
-                    return "settings"
-                elif option == "Quit":
-                    return "quit"
-            elif event.key == back:
-                return "quit"  # Escape/Back quits game
+        
+        # Background scaled to the screen, rebuilt only when the screen size changes
+        self._scaled_bg = None
+        self._scaled_size = None
 
     def draw(self, screen):
         # Draw start menu
         # Draw background
         if self.background_image:
             # Scale background to fit screen
-            scaled_bg = pygame.transform.scale(self.background_image, (screen.get_width(), screen.get_height()))
-            screen.blit(scaled_bg, (0, 0))
+            size = screen.get_size()
+            if self._scaled_size != size:
+                self._scaled_bg = pygame.transform.scale(self.background_image, size)
+                self._scaled_size = size
+            screen.blit(self._scaled_bg, (0, 0))
         else:
             # Default dark background
             screen.fill((20, 20, 40))
         
         # Draw title
-        title_y = screen.get_height() // 4
+        screen_w, screen_h = screen.get_size()
+        title_y = screen_h // 4
         if self.title_image:
             # Center the title image
-            title_x = (screen.get_width() - self.title_image.get_width()) // 2
+            title_x = (screen_w - self.title_image.get_width()) // 2
             screen.blit(self.title_image, (title_x, title_y))
         else:
             # Default text title
-            title_text = self.font.render("Eminence in Shadow: Restart", True, (255, 255, 255))
-            title_x = (screen.get_width() - title_text.get_width()) // 2
+            title_text = render_text(self.font, "Eminence in Shadow: Restart", (255, 255, 255))
+            title_x = (screen_w - title_text.get_width()) // 2
             screen.blit(title_text, (title_x, title_y))
         
         # Draw menu options (centered below title)
-        menu_start_y = screen.get_height() // 2 + 100
-        for i, option in enumerate(self.options):
+        menu_start_y = screen_h // 2 + 100
+        blits = []
+        for i, (option, _) in enumerate(self.options):
             color = (255, 255, 0) if i == self.selected else (255, 255, 255)
-            text = self.font.render(option, True, color)
-            text_x = (screen.get_width() - text.get_width()) // 2
+            text = render_text(self.font, option, color)
+            text_x = (screen_w - text.get_width()) // 2
             text_y = menu_start_y + i * 50
-            screen.blit(text, (text_x, text_y))
+            blits.append((text, (text_x, text_y)))
+        screen.blits(blits, doreturn=False)
 
 # ----------------------------
 # PAUSE MENU (fills top of screen)
 # ----------------------------
 class PauseMenu:
+    __slots__ = ("font", "settings", "options", "selected", "width", "height", "surface", "rect",
+                 "_drawn_selected")
+
     def __init__(self, font, screen_width, settings=None):
         self.font = font
         self.settings = settings
@@ -150,6 +163,7 @@ class PauseMenu:
         self.height = 120  # Increased to fit 2 rows
         self.surface = pygame.Surface((self.width, self.height))
         self.rect = self.surface.get_rect(topleft=(0, 0))  # Top of screen, full width
+        self._drawn_selected = None  # Selection the surface was last drawn with
 
     def handle_input(self, event):
         if event.type != pygame.KEYDOWN:
@@ -182,22 +196,30 @@ class PauseMenu:
             return "resume"  # Back resumes game
 
     def draw(self, screen):
+        # Only the highlighted option ever changes, so redraw just when it moves
+        if self.selected != self._drawn_selected:
+            self._redraw_surface()
+            self._drawn_selected = self.selected
+        screen.blit(self.surface, self.rect.topleft)
+
+    def _redraw_surface(self):
         self.surface.fill((50, 50, 50))
         
         # Title
-        title = self.font.render("PAUSE", True, (255, 255, 255))
+        title = render_text(self.font, "PAUSE", (255, 255, 255))
         self.surface.blit(title, (self.width // 2 - title.get_width() // 2, 5))
         
         # Options in 2 rows (max 4 per row)
         items_per_row = 4
         row_height = 45
         
+        blits = []
         for i, option in enumerate(self.options):
             row = i // items_per_row
             col = i % items_per_row
             
             color = (255, 255, 0) if i == self.selected else (255, 255, 255)
-            text = self.font.render(option, True, color)
+            text = render_text(self.font, option, color)
             
             # Calculate position: spread items evenly across row
             available_width = self.width - 20
@@ -205,14 +227,15 @@ class PauseMenu:
             x_pos = 10 + col * item_width + (item_width - text.get_width()) // 2
             y_pos = 30 + row * row_height
             
-            self.surface.blit(text, (x_pos, y_pos))
-        
-        screen.blit(self.surface, self.rect.topleft)
+            blits.append((text, (x_pos, y_pos)))
+        self.surface.blits(blits, doreturn=False)
 
 # ----------------------------
 # MERCHANT MENU
 # ----------------------------
 class MerchantMenu(BaseMenu):
+    __slots__ = ()
+
     def __init__(self, font, settings=None):
         super().__init__([("Buy", "buy"), ("Sell", "sell"), ("Leave", "close")], font, settings)
 
@@ -220,6 +243,8 @@ class MerchantMenu(BaseMenu):
 # TRAVEL MENU
 # ----------------------------
 class TravelMenu(BaseMenu):
+    __slots__ = ()
+
     def __init__(self, font, destinations, settings=None):
         options = [(name, idx) for name, idx in destinations]
         super().__init__(options, font, settings)
@@ -228,6 +253,11 @@ class TravelMenu(BaseMenu):
 # SETTINGS MENU (with zoom control)
 # ----------------------------
 class SettingsMenu:
+    __slots__ = ("font", "settings", "config", "options", "selected", "waiting_for_key",
+                 "_surface", "_drawn_state")
+    # Volume option label -> Settings.audio key
+    VOLUME_OPTIONS = {"Master Volume": "master_volume", "Music Volume": "music_volume", "SFX Volume": "sfx_volume"}
+
     def __init__(self, font, settings, config):
         self.font = font
         self.settings = settings
@@ -235,6 +265,9 @@ class SettingsMenu:
         self.options = ["Master Volume", "Music Volume", "SFX Volume", "Zoom Level", "Keybinds", "Back"]
         self.selected = 0
         self.waiting_for_key = None  # Which action is waiting for keybind
+        # Panel kept between frames; rebuilt when the selection or settings change
+        self._surface = pygame.Surface((600, 400))
+        self._drawn_state = None
 
     def handle_input(self, event):
         if event.type != pygame.KEYDOWN:
@@ -264,99 +297,87 @@ class SettingsMenu:
                 return "close"
             elif choice == "Keybinds":
                 return "keybinds"
-            elif choice in ["Master Volume", "Music Volume", "SFX Volume"]:
-                key = choice.lower().replace(" ", "_")
-                self.settings.set_audio(key, min(1.0, self.settings.audio[key] + 0.1))
-                return "audio_changed"
+            elif choice in self.VOLUME_OPTIONS:
+                return self._adjust_volume(choice, 0.1)
             elif choice == "Zoom Level":
-                # Cycle through zoom levels
-                try:
-                    current_zoom = self.settings.display.get("zoom_level", 1.5)
-                    if current_zoom in self.config.AVAILABLE_ZOOM_LEVELS:
-                        current_index = self.config.AVAILABLE_ZOOM_LEVELS.index(current_zoom)
-                    else:
-                        current_index = 0
-                    next_index = (current_index + 1) % len(self.config.AVAILABLE_ZOOM_LEVELS)
-                    self.settings.set_display("zoom_level", self.config.AVAILABLE_ZOOM_LEVELS[next_index])
-                    return "zoom_changed"
-                except Exception as e:
-                    print(f"Zoom error: {e}")
-            elif choice == "Keybinds":
-                return "keybinds"
+                return self._cycle_zoom(1)
         elif event.key == left:
             choice = self.options[self.selected]
-            if choice in ["Master Volume", "Music Volume", "SFX Volume"]:
-                key = choice.lower().replace(" ", "_")
-                self.settings.set_audio(key, max(0.0, self.settings.audio[key] - 0.1))
-                return "audio_changed"
+            if choice in self.VOLUME_OPTIONS:
+                return self._adjust_volume(choice, -0.1)
             elif choice == "Zoom Level":
                 # Cycle backwards through zoom levels
-                try:
-                    current_zoom = self.settings.display.get("zoom_level", 1.5)
-                    if current_zoom in self.config.AVAILABLE_ZOOM_LEVELS:
-                        current_index = self.config.AVAILABLE_ZOOM_LEVELS.index(current_zoom)
-                    else:
-                        current_index = 0
-                    next_index = (current_index - 1) % len(self.config.AVAILABLE_ZOOM_LEVELS)
-                    self.settings.set_display("zoom_level", self.config.AVAILABLE_ZOOM_LEVELS[next_index])
-                    return "zoom_changed"
-                except Exception as e:
-                    print(f"Zoom error: {e}")
+                return self._cycle_zoom(-1)
         elif event.key == right:
             choice = self.options[self.selected]
-            if choice in ["Master Volume", "Music Volume", "SFX Volume"]:
-                key = choice.lower().replace(" ", "_")
-                self.settings.set_audio(key, min(1.0, self.settings.audio[key] + 0.1))
-                return "audio_changed"
+            if choice in self.VOLUME_OPTIONS:
+                return self._adjust_volume(choice, 0.1)
             elif choice == "Zoom Level":
-                # Cycle through zoom levels
-                try:
-                    current_zoom = self.settings.display.get("zoom_level", 1.5)
-                    if current_zoom in self.config.AVAILABLE_ZOOM_LEVELS:
-                        current_index = self.config.AVAILABLE_ZOOM_LEVELS.index(current_zoom)
-                    else:
-                        current_index = 0
-                    next_index = (current_index + 1) % len(self.config.AVAILABLE_ZOOM_LEVELS)
-                    self.settings.set_display("zoom_level", self.config.AVAILABLE_ZOOM_LEVELS[next_index])
-                    return "zoom_changed"
-                except Exception as e:
-                    print(f"Zoom error: {e}")
+                return self._cycle_zoom(1)
         elif event.key == back:
             return "close"  # Back to previous menu
 
         return None
 
+    def _adjust_volume(self, choice, delta):
+        """Nudge the volume behind a menu option by delta, clamped to 0..1"""
+        key = self.VOLUME_OPTIONS[choice]
+        self.settings.set_audio(key, min(1.0, max(0.0, self.settings.audio[key] + delta)))
+        return "audio_changed"
+
+    def _cycle_zoom(self, step):
+        """Move step places through the available zoom levels (wrapping)"""
+        try:
+            levels = self.config.AVAILABLE_ZOOM_LEVELS
+            current_zoom = self.settings.display.get("zoom_level", 1.5)
+            current_index = levels.index(current_zoom) if current_zoom in levels else 0
+            self.settings.set_display("zoom_level", levels[(current_index + step) % len(levels)])
+            return "zoom_changed"
+        except Exception as e:
+            print(f"Zoom error: {e}")
+            return None
+
     def draw(self, screen):
-        width, height = 600, 400
-        surf = pygame.Surface((width, height))
+        state = (self.settings.version, self.selected)
+        if state != self._drawn_state:
+            self._redraw_surface()
+            self._drawn_state = state
+
+        rect = self._surface.get_rect(center=(screen.get_width() // 2, screen.get_height() // 2))
+        screen.blit(self._surface, rect.topleft)
+
+    def _redraw_surface(self):
+        surf = self._surface
+        width, height = surf.get_size()
         surf.fill((40, 40, 40))
 
         for i, option in enumerate(self.options):
             color = (255, 255, 0) if i == self.selected else (255, 255, 255)
             display_text = option
             # Show audio levels
-            if option in ["Master Volume", "Music Volume", "SFX Volume"]:
-                key = option.lower().replace(" ", "_")
+            if option in self.VOLUME_OPTIONS:
+                key = self.VOLUME_OPTIONS[option]
                 display_text += f": {int(self.settings.audio[key]*100)}%"
             # Show zoom level
             elif option == "Zoom Level":
                 current_zoom = self.settings.display.get("zoom_level", 1.5)
                 display_text += f": {current_zoom}x"
 
-            text = self.font.render(display_text, True, color)
+            text = render_text(self.font, display_text, color)
             surf.blit(text, (40, 40 + i * 40))
         
         # Add instructions
-        instructions = self.font.render("Use A/D to change values", True, (150, 150, 150))
+        instructions = render_text(self.font, "Use A/D to change values", (150, 150, 150))
         surf.blit(instructions, (width // 2 - instructions.get_width() // 2, height - 40))
 
-        rect = surf.get_rect(center=(screen.get_width() // 2, screen.get_height() // 2))
-        screen.blit(surf, rect.topleft)
-
 # ----------------------------
 # STATUS MENU (displays character stats)
 # ----------------------------
 class StatusMenu:
+    __slots__ = ("font", "player", "settings", "title_font", "small_font", "allocatable_stats",
+                 "selected_stat", "menu_options", "selected_option", "_background", "_surface",
+                 "_drawn_state")
+
     def __init__(self, font, player, settings=None):
         self.font = font
         self.player = player
@@ -370,6 +391,27 @@ class StatusMenu:
         # Menu options at bottom
         self.menu_options = ["Equipment", "Close"]
         self.selected_option = -1  # -1 means we're on stats, 0+ means menu options
+        # Panel kept between frames; redrawn when the selection or player stats change
+        self._surface = pygame.Surface((600, 550))
+        self._background = self._build_background()
+        self._drawn_state = None
+
+    def _build_background(self):
+        """Fill, title and instructions never change, so they are drawn only once"""
+        bg = pygame.Surface(self._surface.get_size())
+        width, height = bg.get_size()
+        bg.fill((40, 40, 40))
+        
+        # Title
+        title = render_text(self.title_font, "Character Stats", (255, 215, 0))
+        bg.blit(title, (width // 2 - title.get_width() // 2, 20))
+        
+        # Instructions
+        inst1 = render_text(self.small_font, "W/S: Select | +: Allocate | Enter: Confirm", (150, 150, 150))
+        inst2 = render_text(self.small_font, "ESC: Close", (150, 150, 150))
+        bg.blit(inst1, (width // 2 - inst1.get_width() // 2, height - 60))
+        bg.blit(inst2, (width // 2 - inst2.get_width() // 2, height - 30))
+        return bg
         
     def handle_input(self, event):
         if event.type == pygame.KEYDOWN:
@@ -412,24 +454,28 @@ class StatusMenu:
         return None
     
     def draw(self, screen):
-        width, height = 600, 550
-        surf = pygame.Surface((width, height))
-        surf.fill((40, 40, 40))
+        free_points = getattr(self.player, 'free_stat_points', 0)
+        state = (self.selected_stat, self.selected_option, free_points, tuple(self.player.stats.items()))
+        if state != self._drawn_state:
+            self._redraw_surface(free_points)
+            self._drawn_state = state
         
-        # Title
-        title = self.title_font.render("Character Stats", True, (255, 215, 0))
-        surf.blit(title, (width // 2 - title.get_width() // 2, 20))
+        rect = self._surface.get_rect(center=(screen.get_width() // 2, screen.get_height() // 2))
+        screen.blit(self._surface, rect.topleft)
+
+    def _redraw_surface(self, free_points):
+        surf = self._surface
+        surf.blit(self._background, (0, 0))
         
         # Free stat points
-        free_points = getattr(self.player, 'free_stat_points', 0)
-        points_text = self.font.render(f"Free Points: {free_points}", True, (255, 215, 0))
+        points_text = render_text(self.font, f"Free Points: {free_points}", (255, 215, 0))
         surf.blit(points_text, (50, 60))
         
         # Display non-allocatable stats
         y_offset = 100
-        health_text = self.font.render(f"Health: {self.player.stats['Current_Health']} / {self.player.stats['Max_Health']}", True, (100, 255, 100))
-        mana_text = self.font.render(f"Mana: {self.player.stats['Current_Mana']} / {self.player.stats['Max_Mana']}", True, (100, 150, 255))
-        skill_dmg_text = self.font.render(f"Skill Attack: {self.player.stats['Skill_Attack_Damage']}", True, (200, 200, 200))
+        health_text = render_text(self.font, f"Health: {self.player.stats['Current_Health']} / {self.player.stats['Max_Health']}", (100, 255, 100))
+        mana_text = render_text(self.font, f"Mana: {self.player.stats['Current_Mana']} / {self.player.stats['Max_Mana']}", (100, 150, 255))
+        skill_dmg_text = render_text(self.font, f"Skill Attack: {self.player.stats['Skill_Attack_Damage']}", (200, 200, 200))
         
         surf.blit(health_text, (50, y_offset))
         surf.blit(mana_text, (50, y_offset + 35))
@@ -444,7 +490,7 @@ class StatusMenu:
             stat_value = self.player.stats.get(stat_name, 0)
             display_name = stat_name.replace("_", " ")
             stat_text = f"{display_name}: {stat_value} +"
-            text = self.font.render(stat_text, True, color)
+            text = render_text(self.font, stat_text, color)
             surf.blit(text, (50, y_offset + i * 35))
         
         # Menu options at bottom
@@ -452,17 +498,8 @@ class StatusMenu:
         for i, opt in enumerate(self.menu_options):
             is_selected = (self.selected_option == i)
             color = (255, 215, 0) if is_selected else (200, 200, 200)
-            opt_text = self.font.render(f"[ {opt} ]", True, color)
+            opt_text = render_text(self.font, f"[ {opt} ]", color)
             surf.blit(opt_text, (50 + i * 150, option_y))
-        
-        # Instructions
-        inst1 = self.small_font.render("W/S: Select | +: Allocate | Enter: Confirm", True, (150, 150, 150))
-        inst2 = self.small_font.render("ESC: Close", True, (150, 150, 150))
-        surf.blit(inst1, (width // 2 - inst1.get_width() // 2, height - 60))
-        surf.blit(inst2, (width // 2 - inst2.get_width() // 2, height - 30))
-        
-        rect = surf.get_rect(center=(screen.get_width() // 2, screen.get_height() // 2))
-        screen.blit(surf, rect.topleft)
 
 
 # ----------------------------
@@ -492,6 +529,10 @@ class EquipmentMenu:
         self.highlight_color = (255, 215, 0)
         self.normal_color = (200, 200, 200)
         self.equipped_color = (100, 255, 100)
+        
+        # Panel surfaces are reused every frame instead of reallocated
+        self._surface = pygame.Surface((500, 450))
+        self._picker = pygame.Surface((220, 280), pygame.SRCALPHA)
     
     def get_equipment(self):
         """Get player's current equipment or return demo data"""
@@ -576,12 +617,12 @@ class EquipmentMenu:
     def draw(self, screen):
         screen_w, screen_h = screen.get_size()
         width, height = 500, 450
-        surf = pygame.Surface((width, height))
+        surf = self._surface
         surf.fill((40, 40, 50))
         pygame.draw.rect(surf, self.highlight_color, (0, 0, width, height), 3)
         
         # Title
-        title = self.title_font.render("Equipment", True, self.highlight_color)
+        title = render_text(self.title_font, "Equipment", self.highlight_color)
         surf.blit(title, (width // 2 - title.get_width() // 2, 15))
         
         equipment = self.get_equipment()
@@ -595,15 +636,15 @@ class EquipmentMenu:
             
             # Slot name
             slot_color = self.highlight_color if is_selected else self.normal_color
-            slot_text = self.font.render(f"{slot}:", True, slot_color)
+            slot_text = render_text(self.font, f"{slot}:", slot_color)
             surf.blit(slot_text, (30, y_start + i * row_height))
             
             # Equipped item
             if equipped:
                 item_name = equipped.get("name", "Unknown")
-                item_text = self.font.render(item_name, True, self.equipped_color)
+                item_text = render_text(self.font, item_name, self.equipped_color)
             else:
-                item_text = self.font.render("(Empty)", True, (100, 100, 100))
+                item_text = render_text(self.font, "(Empty)", (100, 100, 100))
             surf.blit(item_text, (180, y_start + i * row_height))
         
         # If picking item, draw item list overlay
@@ -612,9 +653,9 @@ class EquipmentMenu:
         
         # Instructions
         if self.picking_item:
-            inst = self.small_font.render("W/S: Select | Enter: Equip | ESC: Cancel", True, (150, 150, 150))
+            inst = render_text(self.small_font, "W/S: Select | Enter: Equip | ESC: Cancel", (150, 150, 150))
         else:
-            inst = self.small_font.render("W/S: Select | Enter: Change | X: Unequip | ESC: Close", True, (150, 150, 150))
+            inst = render_text(self.small_font, "W/S: Select | Enter: Change | X: Unequip | ESC: Close", (150, 150, 150))
         surf.blit(inst, (width // 2 - inst.get_width() // 2, height - 25))
         
         rect = surf.get_rect(center=(screen_w // 2, screen_h // 2))
@@ -627,30 +668,30 @@ class EquipmentMenu:
         picker_x = width - picker_w - 20
         picker_y = 50
         
-        picker = pygame.Surface((picker_w, picker_h), pygame.SRCALPHA)
+        picker = self._picker
         picker.fill((30, 30, 40, 240))
         pygame.draw.rect(picker, self.highlight_color, (0, 0, picker_w, picker_h), 2)
         
         # Title
         slot = self.SLOTS[self.selected_slot]
-        title = self.small_font.render(f"Select {slot}", True, self.highlight_color)
+        title = render_text(self.small_font, f"Select {slot}", self.highlight_color)
         picker.blit(title, (picker_w // 2 - title.get_width() // 2, 8))
         
         # Items
         if not self.available_items:
-            empty = self.small_font.render("No items", True, (100, 100, 100))
+            empty = render_text(self.small_font, "No items", (100, 100, 100))
             picker.blit(empty, (picker_w // 2 - empty.get_width() // 2, 50))
         else:
             for i, (item_name, item_stats) in enumerate(self.available_items):
                 is_selected = (i == self.selected_item)
                 color = self.highlight_color if is_selected else self.normal_color
                 
-                item_text = self.small_font.render(item_name, True, color)
+                item_text = render_text(self.small_font, item_name, color)
                 picker.blit(item_text, (15, 35 + i * 28))
                 
                 # Show stats
                 stats_str = ", ".join(f"+{v} {k[:3]}" for k, v in item_stats.items())
-                stats_text = self.small_font.render(stats_str, True, (150, 150, 150))
+                stats_text = render_text(self.small_font, stats_str, (150, 150, 150))
                 picker.blit(stats_text, (15, 35 + i * 28 + 14))
         
         surf.blit(picker, (picker_x, picker_y))
@@ -680,6 +721,9 @@ class KeyBindsMenu:
             "Block": "Block/Counter (F)",
             "Pause": "Pause Menu",
         }
+        # Panel kept between frames; rebuilt when the selection, remap or keybinds change
+        self._surface = pygame.Surface((600, 550))
+        self._drawn_state = None
 
     def handle_input(self, event):
         if event.type != pygame.KEYDOWN:
@@ -713,12 +757,21 @@ class KeyBindsMenu:
         return self.keybind_actions
 
     def draw(self, screen):
-        width, height = 600, 550
-        surf = pygame.Surface((width, height))
+        state = (self.settings.version, self.selected, self.waiting_for_key)
+        if state != self._drawn_state:
+            self._redraw_surface()
+            self._drawn_state = state
+
+        rect = self._surface.get_rect(center=(screen.get_width() // 2, screen.get_height() // 2))
+        screen.blit(self._surface, rect.topleft)
+
+    def _redraw_surface(self):
+        surf = self._surface
+        width, height = surf.get_size()
         surf.fill((40, 40, 40))
 
         # Title
-        title = self.title_font.render("Keybinds", True, (255, 215, 0))
+        title = render_text(self.title_font, "Keybinds", (255, 215, 0))
         surf.blit(title, (width // 2 - title.get_width() // 2, 20))
 
         # Keybinds list
@@ -735,19 +788,16 @@ class KeyBindsMenu:
             else:
                 display_text = f"{label}: {current_key.upper()}"
 
-            text = self.font.render(display_text, True, color)
+            text = render_text(self.font, display_text, color)
             surf.blit(text, (60, y_offset + i * 50))
 
         # Instructions
         instructions_y = height - 80
-        inst1 = self.small_font.render("W/S: Navigate  |  E/Enter: Rebind", True, (200, 200, 200))
-        inst2 = self.small_font.render("ESC: Back", True, (200, 200, 200))
+        inst1 = render_text(self.small_font, "W/S: Navigate  |  E/Enter: Rebind", (200, 200, 200))
+        inst2 = render_text(self.small_font, "ESC: Back", (200, 200, 200))
         surf.blit(inst1, (width // 2 - inst1.get_width() // 2, instructions_y))
         surf.blit(inst2, (width // 2 - inst2.get_width() // 2, instructions_y + 30))
 
-        rect = surf.get_rect(center=(screen.get_width() // 2, screen.get_height() // 2))
-        screen.blit(surf, rect.topleft)
-
 
 """
 
@@ -775,6 +825,9 @@ class ScrollableLayout:
         self.scroll_offset = 0
         self.scroll_speed = 20
         self.max_scroll = 850  # How far down you can scroll
+        # Pre-drawn boxes, rebuilt when the screen width changes
+        self._layout = None
+        self._layout_width = None
 
     # Backwards-compatible init (if called elsewhere)
     def init(self):
@@ -795,6 +848,17 @@ class ScrollableLayout:
         return None
 
     def draw(self, screen):
+        # The boxes never change, so they are drawn once per screen width and
+        # the scroll offset just moves where that layout is blitted
+        width = screen.get_width()
+        if self._layout_width != width:
+            self._layout = self._build_layout(width)
+            self._layout_width = width
+        screen.fill((0, 0, 0))
+        screen.blit(self._layout, (0, -self.scroll_offset))
+
+    def _build_layout(self, width):
+        """Draw both sets of boxes, unscrolled, onto a surface as tall as the content"""
         
         # Define colors
         BLACK = (0, 0, 0)
@@ -802,60 +866,39 @@ class ScrollableLayout:
         DARK_GREY = (90, 92, 99)
         PURPLE = (63, 48, 75)
         WHITE = (255, 255, 255)
-        SCREEN_WIDTH = screen.get_width()
-        SCREEN_HEIGHT = screen.get_height()
+        second_set_offset = 850  # Distance between sets
+        layout = pygame.Surface((width, second_set_offset + 497 + 268))
 
         # Calculate center offset (shifted left)
-        center_x = SCREEN_WIDTH // 2 - 180
+        center_x = width // 2 - 180
 
         # Fill background with black
-        screen.fill(BLACK)
-
-        # Apply scroll offset to y positions
-        y_offset = -self.scroll_offset
+        layout.fill(BLACK)
 
-        # Top grey instruction box
         box_width = 586
         box_x = center_x - box_width // 2
-        pygame.draw.rect(screen, DARK_GREY, (box_x, 76 + y_offset, box_width, 60))
-
-        # Add "Instructions" text to top box
-        font = get_font(36)
-        text = font.render("Instructions", True, WHITE)
-        text_rect = text.get_rect(center=(center_x, 106 + y_offset))
-        screen.blit(text, text_rect)
-
-        # First purple game area
         purple_width = 712
         purple_x = center_x - purple_width // 2
-        pygame.draw.rect(screen, PURPLE, (purple_x, 172 + y_offset, purple_width, 205))
-
-        # Middle grey title box (separated from first purple box)
         divider_width = 588
         divider_x = center_x - divider_width // 2
-        pygame.draw.rect(screen, GREY, (divider_x, 407 + y_offset, divider_width, 60))
-
-    # Second purple game area
-        pygame.draw.rect(screen, PURPLE, (purple_x, 497 + y_offset, purple_width, 268))
-
-    # === SECOND SET OF BOXES (below the first set) ===
-        second_set_offset = 850  # Distance between sets
+        font = get_font(36)
+        text = render_text(font, "Instructions", WHITE)
 
-    # Second instruction box
-        pygame.draw.rect(screen, DARK_GREY, (box_x, 76 + y_offset + second_set_offset, box_width, 60))
-        text2 = font.render("Instructions", True, WHITE)
-        text_rect2 = text2.get_rect(center=(center_x, 106 + y_offset + second_set_offset))
-        screen.blit(text2, text_rect2)
+        for y_offset in (0, second_set_offset):
+            # Grey instruction box with its "Instructions" label
+            pygame.draw.rect(layout, DARK_GREY, (box_x, 76 + y_offset, box_width, 60))
+            layout.blit(text, text.get_rect(center=(center_x, 106 + y_offset)))
 
-    # Third purple area
-        pygame.draw.rect(screen, PURPLE, (purple_x, 172 + y_offset + second_set_offset, purple_width, 205))
+            # Upper purple game area
+            pygame.draw.rect(layout, PURPLE, (purple_x, 172 + y_offset, purple_width, 205))
 
-    # Second middle grey title box (separated)
-        pygame.draw.rect(screen, GREY, (divider_x, 407 + y_offset + second_set_offset, divider_width, 60))
+            # Middle grey title box (separated from the purple areas)
+            pygame.draw.rect(layout, GREY, (divider_x, 407 + y_offset, divider_width, 60))
 
-    # Fourth purple area
-        pygame.draw.rect(screen, PURPLE, (purple_x, 497 + y_offset + second_set_offset, purple_width, 268))
+            # Lower purple game area
+            pygame.draw.rect(layout, PURPLE, (purple_x, 497 + y_offset, purple_width, 268))
 
+        return layout
 
 # ----------------------------
 # INVENTORY MENU (Categories + Items)
@@ -865,11 +908,22 @@ INVENTORY_BG_PATH = os.path.join("Assets", "Photos", "Inventory.png")
 INV_CATEGORIES_PATH = os.path.join("Assets", "Photos", "Inv_categories.png")
 INV_ITEMS_PATH = os.path.join("Assets", "Photos", "Inv_items.png")
 
+@lru_cache(maxsize=None)
 def get_grape_font(size):
     """Get Grape Soda font if available, else fallback"""
     return pygame.font.Font(GRAPE_SODA_PATH if os.path.exists(GRAPE_SODA_PATH) else None, size)
 
 
+@lru_cache(maxsize=64)
+def _load_item_icon(path, size):
+    """Load an item image scaled to size x size, or None if it can't be read"""
+    try:
+        image = pygame.image.load(path).convert_alpha()
+        return pygame.transform.smoothscale(image, (size, size))
+    except:
+        return None
+
+
 class InventoryMenu:
     """
     Two-panel inventory menu:
@@ -1070,7 +1124,7 @@ class InventoryMenu:
         self._draw_items_text(screen, item_x, item_y, item_w, item_h)
         
         # Instructions
-        inst = self.small_font.render("W/S: Navigate | A/D: Switch panels | ESC: Close", True, (220, 220, 220))
+        inst = render_text(self.small_font, "W/S: Navigate | A/D: Switch panels | ESC: Close", (220, 220, 220))
         screen.blit(inst, (screen_w // 2 - inst.get_width() // 2, screen_h - 20))
     
     def _draw_description_panel(self, screen, x, y, w, h):
@@ -1101,24 +1155,23 @@ class InventoryMenu:
             
             # Try to load and draw item image
             if item_image_path and os.path.exists(item_image_path):
-                try:
-                    item_img = pygame.image.load(item_image_path).convert_alpha()
-                    item_img = pygame.transform.smoothscale(item_img, (img_size - 8, img_size - 8))
+                item_img = _load_item_icon(item_image_path, img_size - 8)
+                if item_img is not None:
                     panel.blit(item_img, (img_x + 4, img_y + 4))
-                except:
+                else:
                     # Draw placeholder icon
-                    placeholder = self.small_font.render("?", True, (100, 100, 100))
+                    placeholder = render_text(self.small_font, "?", (100, 100, 100))
                     panel.blit(placeholder, (img_x + img_size // 2 - placeholder.get_width() // 2, 
                                              img_y + img_size // 2 - placeholder.get_height() // 2))
             else:
                 # Draw placeholder icon
-                placeholder = self.font.render("?", True, (100, 100, 100))
+                placeholder = render_text(self.font, "?", (100, 100, 100))
                 panel.blit(placeholder, (img_x + img_size // 2 - placeholder.get_width() // 2, 
                                          img_y + img_size // 2 - placeholder.get_height() // 2))
             
             # Item name and count (right of image)
             text_x = img_x + img_size + 15
-            name_text = self.font.render(f"{item_name} x{item_count}", True, self.highlight_color)
+            name_text = render_text(self.font, f"{item_name} x{item_count}", self.highlight_color)
             panel.blit(name_text, (text_x, 15))
             
             # Description text (word wrap)
@@ -1143,11 +1196,11 @@ class InventoryMenu:
             
             # Draw description lines
             for i, line in enumerate(lines[:3]):  # Max 3 lines
-                desc_render = self.small_font.render(line, True, (200, 200, 200))
+                desc_render = render_text(self.small_font, line, (200, 200, 200))
                 panel.blit(desc_render, (desc_text_x, desc_text_y + i * 22))
         else:
             # No item selected
-            hint = self.font.render("Select an item to see details", True, (100, 100, 100))
+            hint = render_text(self.font, "Select an item to see details", (100, 100, 100))
             panel.blit(hint, (w // 2 - hint.get_width() // 2, h // 2 - hint.get_height() // 2))
         
         screen.blit(panel, (x, y))
@@ -1174,7 +1227,7 @@ class InventoryMenu:
             else:
                 color = self.normal_color
             
-            text = self.font.render(cat, True, color)
+            text = render_text(self.font, cat, color)
             text_y = text_start_y + i * row_h
             screen.blit(text, (text_x, text_y))
     
@@ -1182,7 +1235,7 @@ class InventoryMenu:
         """Overlay items text on the items panel image"""
         # Category title at top of panel
         cat_name = self.categories[self.selected_category]
-        title = self.title_font.render(cat_name.upper(), True, self.highlight_color)
+        title = render_text(self.title_font, cat_name.upper(), self.highlight_color)
         screen.blit(title, (x + w // 2 - title.get_width() // 2, y + 10))
         
         items = self.get_current_items()
@@ -1191,7 +1244,7 @@ class InventoryMenu:
         row_h = (h - 100) // self.visible_item_rows
         
         if not items:
-            empty = self.font.render("(Empty)", True, (150, 150, 150))
+            empty = render_text(self.font, "(Empty)", (150, 150, 150))
             screen.blit(empty, (x + w // 2 - empty.get_width() // 2, text_start_y + 30))
         else:
             for i in range(self.visible_item_rows):
@@ -1212,7 +1265,7 @@ class InventoryMenu:
                     color = self.normal_color
                 
                 display_text = f"{item_name} x{item_count}"
-                text = self.font.render(display_text, True, color)
+                text = render_text(self.font, display_text, color)
                 text_y = text_start_y + i * row_h
                 screen.blit(text, (text_x, text_y))
 
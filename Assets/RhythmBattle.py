@@ -14,6 +14,8 @@ Features:
 
 import pygame
 import math
+import time
+from collections import deque
 
 class RhythmTiming:
     """Defines timing windows for rhythm accuracy"""
@@ -42,6 +44,9 @@ class RhythmTiming:
 
 class RhythmAttack:
     """Represents a single attack with rhythm timing"""
+    __slots__ = ("attack_type", "direction", "timestamp", "beat_time", "accuracy", "multiplier",
+                 "feedback_timer", "feedback_text", "feedback_color")
+
     def __init__(self, attack_type, direction, timestamp, beat_time):
         self.attack_type = attack_type       # "neutral", "forward", "down", etc.
         self.direction = direction           # Direction held during attack
@@ -95,14 +100,19 @@ class RhythmBattleSystem:
     """Main rhythm battle system - integrates with game"""
     def __init__(self, audio_system):
         self.audio_system = audio_system
-        self.combo_chain = []           # List of recent attacks
+        self.combo_chain = deque(maxlen=5)  # Last 5 attacks
         self.combo_count = 0            # Current combo count
+        self._combo_mult_count = 0      # Combo count the cached multiplier belongs to
+        self._combo_mult = 1.0
         self.last_attack_time = 0       # Time of last attack
         self.combo_timeout = 2.0        # Combo breaks after 2 seconds (updated dynamically)
+        self._combo_timeout_bpm = None  # BPM the current combo_timeout was computed for
         self._update_combo_timeout()    # Set initial timeout based on BPM
         
         # Visual feedback
         self.feedback_displays = []     # Active feedback to show
+        self._combo_text_count = None   # Combo count the cached HUD strings were built for
+        self._combo_texts = ("", "")
         self.beat_indicators = []       # Visual beat indicators
         
         # Attack state
@@ -175,10 +185,14 @@ class RhythmBattleSystem:
         """Update combo timeout based on current song BPM"""
         if not self.audio_system.current_song:
             self.combo_timeout = 2.0
+            self._combo_timeout_bpm = None
             return
         
         bpm = self.audio_system.current_song.bpm
-        seconds_per_beat = self.audio_system.current_song.seconds_per_beat
+        if bpm == self._combo_timeout_bpm:
+            return  # Called every frame; only recompute when the BPM changes
+        self._combo_timeout_bpm = bpm
+        seconds_per_beat = 60.0 / bpm
         
         # If BPM > 100, use half notes (2 beats) for combo timing
         if bpm > RhythmTiming.HIGH_BPM_THRESHOLD:
@@ -204,22 +218,23 @@ class RhythmBattleSystem:
             self.combo_count = 0
             self.combo_chain.clear()
         
-        # Keep only last 5 attacks
-        if len(self.combo_chain) > 5:
-            self.combo_chain.pop(0)
-        
         self.last_attack_time = current_time
     
     def get_combo_multiplier(self):
         """Get total damage multiplier from combo chain"""
-        if self.combo_count == 0:
-            return 1.0
+        if self.combo_count == self._combo_mult_count:
+            return self._combo_mult
         
-        combo_bonus = min(
-            self.combo_count * RhythmTiming.COMBO_MULTIPLIER_PER_HIT,
-            RhythmTiming.MAX_COMBO_BONUS
-        )
-        return 1.0 + combo_bonus
+        self._combo_mult_count = self.combo_count
+        if self.combo_count == 0:
+            self._combo_mult = 1.0
+        else:
+            combo_bonus = min(
+                self.combo_count * RhythmTiming.COMBO_MULTIPLIER_PER_HIT,
+                RhythmTiming.MAX_COMBO_BONUS
+            )
+            self._combo_mult = 1.0 + combo_bonus
+        return self._combo_mult
     
     def get_total_multiplier(self):
         """Get total multiplier including combo and timing"""
@@ -276,9 +291,11 @@ class RhythmBattleSystem:
         if self.combo_count == 0:
             return
         
-        # Draw combo count
-        combo_text = f"{self.combo_count} HIT COMBO"
-        multiplier_text = f"x{self.get_combo_multiplier():.1f} DAMAGE"
+        # Draw combo count (strings only change when the combo count does)
+        if self._combo_text_count != self.combo_count:
+            self._combo_text_count = self.combo_count
+            self._combo_texts = (f"{self.combo_count} HIT COMBO", f"x{self.get_combo_multiplier():.1f} DAMAGE")
+        combo_text, multiplier_text = self._combo_texts
         
         # Position in top right
         x = screen.get_width() - 20
@@ -304,7 +321,6 @@ class RhythmBattleSystem:
         """Draw Osu-style rhythm circle - bottom-center; hits inner exactly on beat"""
         if not self.audio_system.current_song:
             return
-        import time
         bpm = self.audio_system.current_song.bpm
         seconds_per_beat = self.audio_system.current_song.seconds_per_beat
         last_beat = self.audio_system.current_song.last_beat_time
@@ -5,6 +5,7 @@ import os
 class Settings:
     def __init__(self, file_path="Assets/settings.json"):
         self.file_path = file_path
+        self.version = 0  # Bumped on every load/save so menus know when to rebuild labels
         self.audio = {
             "master_volume": 1.0,
             "music_volume": 1.0,
@@ -33,8 +34,10 @@ class Settings:
                 self.audio.update(data.get("audio", {}))
                 self.keybinds.update(data.get("keybinds", {}))
                 self.display.update(data.get("display", {}))
+        self.version += 1
 
     def save(self):
+        self.version += 1
         data = {
             "audio": self.audio,
             "keybinds": self.keybinds,
@@ -21,7 +21,8 @@ import importlib.util
 import os
 import numpy as np
 from Assets.Settings import Settings
-from Assets.Characters import MainCharacter
+from Assets.Characters import MainCharacter, SmallBandit, step_enemy_physics, apply_damage_batch
+from Assets.Interactables import Coin, draw_interactables, update_coins, slope_geometry, first_slope_under
 from Assets.Menus import StartMenu, PauseMenu, MerchantMenu, TravelMenu, SettingsMenu, StatusMenu, ScrollableLayout, InventoryMenu, EquipmentMenu
 from Assets.AudioConfig import AudioSystem, MusicManager
 from Assets.RhythmBattle import RhythmBattleSystem
@@ -49,6 +50,7 @@ class Config:
     
     # Level
     SEGMENT_WIDTH = 768
+    SEGMENT_KEEP_DISTANCE = 8  # Infinite levels drop segments further than this from the player
     
     # Player
     PLAYER_WIDTH = 64
@@ -166,8 +168,14 @@ class Game:
 
         # Level management
         self.level_files = self.config.LEVEL_PATHS
+        # Display names ("Dark Forest") for each level file, used by travel menus/transitions
+        self.level_names = [lvl.split('/')[-1].replace('.py', '').replace('_', ' ') for lvl in self.level_files]
         self.current_level_index = 0
         self.level_data = {}
+        self._level_modules = {}  # filepath -> executed level module, so static rooms build once
+        self._scene_index = {}  # Per-list x-sorted index for viewport culling
+        self._slope_index = None  # Packed tent/rock geometry for slope physics
+        self._terrain_index = None  # Cached ground/platform rects + bounds for collision queries
         
         # Drops (flying loot on enemy death)
         self.drops = []
@@ -212,6 +220,9 @@ class Game:
         self.go_back_timer = 0.0
         self.go_back_fade_phase = None  # None, "fade_out", "fade_in"
         self.go_back_fade_alpha = 0
+        self._fade_surface = None  # Reused black overlay for the go-back fade
+        self._menu_backdrop = None  # Snapshot of the paused world drawn under open menus
+        self._menu_backdrop_key = None
         self.go_back_start_pos = (0, 0)  # Store player position when timer starts
         
         # Load images if enabled
@@ -326,10 +337,13 @@ class Game:
     # ==================== LEVEL MANAGEMENT ====================
     def load_level(self, filepath):
         """Load a new level from a Python file"""
-        # Import the level file as a Python module
-        spec = importlib.util.spec_from_file_location("level_module", filepath)
-        module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(module)
+        # Import the level file as a Python module (once per file; load_level() builds fresh state)
+        module = self._level_modules.get(filepath)
+        if module is None:
+            spec = importlib.util.spec_from_file_location("level_module", filepath)
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            self._level_modules[filepath] = module
         self.level_data = module.load_level()  # Get level data (enemies, platforms, etc)
         
         # Reset player to starting position
@@ -425,12 +439,59 @@ class Game:
             print(f"Error loading game: {e}")
             return False
 
-    def get_collision_rects(self):
-        """Get list of all solid objects player can collide with"""
-        rects = [
-            *self.level_data.get("ground", []),  # Solid ground
-            *self.level_data.get("platforms", [])  # Floating platforms
-        ]
+    def _terrain_rects(self):
+        """Ground/platform rects and their (left, top, right, bottom) bounds, cached
+        
+        Returns (level_rects, level_bounds, segment_rects, segment_bounds). Terrain
+        never moves; generation only appends and pruning replaces the platform
+        list, so list identity + lengths tell when to rebuild.
+        """
+        ground = self.level_data.get("ground", [])
+        platforms = self.level_data.get("platforms", [])
+        segments = self.level_data.get("segments") if self.level_data.get("infinite", False) else None
+        num_segments = len(segments) if segments is not None else -1
+        
+        cached = self._terrain_index
+        if (cached is None or cached[0] is not ground or cached[1] is not platforms
+                or cached[2] != (len(ground), len(platforms), num_segments)):
+            level_rects = [*ground, *platforms]
+            segment_rects = []
+            if segments is not None:
+                for seg in segments.values():
+                    g = seg["ground"]
+                    segment_rects += [g] if isinstance(g, pygame.Rect) else g
+                    segment_rects += seg["platforms"]
+            cached = (ground, platforms, (len(ground), len(platforms), num_segments),
+                      level_rects, self._rect_bounds(level_rects),
+                      segment_rects, self._rect_bounds(segment_rects))
+            self._terrain_index = cached
+        return cached[3:]
+
+    @staticmethod
+    def _rect_bounds(rects):
+        """(N, 4) array of left, top, right, bottom for a list of Rects"""
+        return np.array([(r.left, r.top, r.right, r.bottom) for r in rects], dtype=np.int64).reshape(-1, 4)
+
+    @staticmethod
+    def _rects_near(rects, bounds, near, margin):
+        """Rects whose bounds come within margin of near (all of them if near is None), in order"""
+        if near is None:
+            return list(rects)
+        mask = ((bounds[:, 0] < near.right + margin) & (bounds[:, 2] > near.left - margin) &
+                (bounds[:, 1] < near.bottom + margin) & (bounds[:, 3] > near.top - margin))
+        return [rects[i] for i in np.flatnonzero(mask)]
+
+    def get_collision_rects(self, near=None, margin=256):
+        """Get list of all solid objects player can collide with
+        
+        Args:
+            near: Optional Rect; if given, ground/platform rects further than
+                  margin from it are left out (order is unchanged)
+            margin: How far around near terrain is still included, in pixels
+        """
+        level_rects, level_bounds, segment_rects, segment_bounds = self._terrain_rects()
+        # Solid ground and floating platforms
+        rects = self._rects_near(level_rects, level_bounds, near, margin)
         # Add interactables that are solid
         rects += [o.rect for o in self.level_data.get("interactables", []) if getattr(o, "collidable", True)]
         # Add slopes (tents and rocks)
@@ -439,11 +500,12 @@ class Game:
         # Add coins
         rects += [c.rect for c in self.level_data.get("coins", []) if hasattr(c, "rect")]
         # For infinite levels, add all current segment collisions
-        if self.level_data.get("infinite", False):
-            for seg in self.level_data["segments"].values():
-                g = seg["ground"]
-                rects += [g] if isinstance(g, pygame.Rect) else g
-                rects += seg["platforms"]
+        spatial_hash = self.level_data.get("spatial_hash") if self.level_data.get("infinite", False) else None
+        if near is not None and spatial_hash is not None:
+            # Only the grid cells around near are looked at
+            rects += spatial_hash.query(near.inflate(2 * margin, 2 * margin))
+        else:
+            rects += self._rects_near(segment_rects, segment_bounds, near, margin)
         return rects
 
     # ==================== CAMERA SYSTEM ====================
@@ -470,9 +532,17 @@ class Game:
         target_x = self._clamp_camera_target_x(target_x, internal_width)
         target_y = self._clamp_camera_target_y(target_y, internal_height)
         
-        # Smoothly move camera to target (not instant)
-        self.camera_x += (target_x - self.camera_x) * self.config.CAMERA_SMOOTHING
-        self.camera_y += (target_y - self.camera_y) * self.config.CAMERA_SMOOTHING
+        # Smoothly move camera to target (not instant), snapping once it has settled
+        diff_x = target_x - self.camera_x
+        diff_y = target_y - self.camera_y
+        if abs(diff_x) < 0.01:
+            self.camera_x = target_x
+        else:
+            self.camera_x += diff_x * self.config.CAMERA_SMOOTHING
+        if abs(diff_y) < 0.01:
+            self.camera_y = target_y
+        else:
+            self.camera_y += diff_y * self.config.CAMERA_SMOOTHING
         
         # Apply screen shake offset
         self.camera_x += self.shake_offset_x
@@ -566,6 +636,7 @@ class Game:
         # Filter per-segment lists to keep future lookups consistent
         if "segments" in self.level_data:
             for seg in self.level_data["segments"].values():
+                self._unhash_platforms(seg, keep_obj)
                 for key in ["platforms", "natural_objects", "tents", "rocks", "interactables", "enemies"]:
                     if key in seg:
                         seg[key] = [o for o in seg[key] if keep_obj(o)]
@@ -593,10 +664,20 @@ class Game:
 
         if "segments" in self.level_data and 0 in self.level_data["segments"]:
             seg = self.level_data["segments"][0]
+            self._unhash_platforms(seg, keep_obj)
             for key in ["platforms", "natural_objects", "tents", "rocks", "interactables", "enemies"]:
                 if key in seg:
                     seg[key] = [o for o in seg[key] if keep_obj(o)]
 
+    def _unhash_platforms(self, seg, keep_obj):
+        """Drop a segment's platforms that keep_obj rejects from the level's spatial hash"""
+        spatial_hash = self.level_data.get("spatial_hash")
+        if spatial_hash is None:
+            return
+        for p in seg.get("platforms", []):
+            if not keep_obj(p):
+                spatial_hash.remove(p)
+
     def get_nearby_interactables(self):
         """Get all interactables near the player"""
         box = self.player.rect.inflate(*self.config.INTERACTION_BOX_INFLATE)
@@ -759,10 +840,7 @@ class Game:
         self.transition_phase = "expand"
         self.transition_radius = 0
         self.transition_target = target_level_index
-        # Get destination name from file path
-        filepath = self.level_files[target_level_index]
-        level_name = filepath.split('/')[-1].replace('.py', '')
-        self.transition_destination_name = level_name.replace("_", " ")
+        self.transition_destination_name = self.level_names[target_level_index]
         self.destination_fade_alpha = 255
         # Play travel sound
         try:
@@ -807,7 +885,6 @@ class Game:
                     for tent in self.level_data.get("interactables", []):
                         if hasattr(tent, "spawn_bandits_after_rest") and tent.spawn_bandits_after_rest:
                             # Spawn 3 bandits near the tent
-                            from Assets.Characters import SmallBandit
                             bandits = [SmallBandit(tent.x + 40 * i, tent.y - 100) for i in range(3)]
                             self.level_data.get("enemies", []).extend(bandits)
                             tent.spawn_bandits_after_rest = False
@@ -907,13 +984,24 @@ class Game:
     # SLOPE PHYSICS
     def handle_slope_physics(self):
         """Handle special physics for sloped polygons (tents and rocks)"""
-        for tent in self.level_data.get("tents", []):
-            if tent.handle_tent_collision(self.player):
-                return
-        
-        for rock in self.level_data.get("rocks", []):
-            if rock.handle_rock_collision(self.player):
-                return
+        tents = self.level_data.get("tents", [])
+        rocks = self.level_data.get("rocks", [])
+        
+        # Repack geometry only when the lists are replaced or change length (slopes never move)
+        cached = self._slope_index
+        if (cached is None or cached[0] is not tents or cached[1] is not rocks
+                or cached[2] != len(tents) or cached[3] != len(rocks)):
+            cached = (tents, rocks, len(tents), len(rocks), slope_geometry([*tents, *rocks]))
+            self._slope_index = cached
+        
+        # Tents take priority over rocks, matching their order in the packed array
+        index = first_slope_under(cached[4], self.player.rect.centerx, self.player.rect.bottom, self.player.y_momentum)
+        if index < 0:
+            return
+        if index < len(tents):
+            tents[index].handle_tent_collision(self.player)
+        else:
+            rocks[index - len(tents)].handle_rock_collision(self.player)
 
     # GAME LOOP 
     def update(self):
@@ -958,9 +1046,11 @@ class Game:
             self.jump_cooldown -= 1
         
         # ========== Update Game Objects ==========
-        # Update coins (collect animations, etc)
-        for coin in self.level_data.get("coins", []):
-            if hasattr(coin, "update"):
+        # Update coins (collect animations, etc) - Coin timers in one vectorized pass
+        coins = self.level_data.get("coins", [])
+        update_coins([coin for coin in coins if isinstance(coin, Coin)], dt)
+        for coin in coins:
+            if not isinstance(coin, Coin) and hasattr(coin, "update"):
                 coin.update(dt)
         
         # Update drops (physics, fading, removal)
@@ -993,10 +1083,17 @@ class Game:
         # Track health before enemy updates for sneak attack detection
         health_before_enemies = self.player.stats.get('Current_Health', 0)
         
+        stepped_enemies = []
         for enemy in self.level_data.get("enemies", []):
             if hasattr(enemy, "update_ai"):
-                # Update enemy AI (behavior, movement, attacks)
-                enemy.update_ai(self.player, rects, self.config.GRAVITY, self.config.MAX_FALL_SPEED, dt, 0, self.frame_counter)
+                # Update enemy AI (behavior, attacks) - physics is batched below
+                enemy.update_ai(self.player, rects, self.config.GRAVITY, self.config.MAX_FALL_SPEED, dt, 0, self.frame_counter,
+                                apply_physics=False)
+                if enemy.state != "dead":
+                    stepped_enemies.append(enemy)
+        
+        # Gravity + movement for every live enemy in one vectorized step
+        step_enemy_physics(stepped_enemies, rects, self.config.GRAVITY, self.config.MAX_FALL_SPEED)
         
         # Check if player took damage during enemy updates - trigger sneak counter
         health_after_enemies = self.player.stats.get('Current_Health', 0)
@@ -1028,19 +1125,20 @@ class Game:
                 hitbox['height']
             )
             
-            for enemy in self.level_data.get("enemies", []):
-                if attack_rect.colliderect(enemy.rect):
-                    # Hit the enemy!
-                    enemy.take_damage(self.player.current_attack['damage'])
-                    enemy.apply_knockback(
-                        self.player.current_attack['knockback_x'] * (1 if self.player.facing_right else -1),
-                        self.player.current_attack['knockback_y'],
-                        stun_duration=0.3
-                    )
-                    
-                    # Screen shake on finisher combo (5 hits = max combo)
-                    if self.rhythm_system.combo_count >= 5:
-                        self.trigger_screen_shake(intensity=0.8, duration=0.15)
+            enemies = self.level_data.get("enemies", [])
+            hit_enemies = [enemies[i] for i in attack_rect.collidelistall([enemy.rect for enemy in enemies])]
+            # Hit the enemies! (damage applied to all of them in one batch)
+            apply_damage_batch(hit_enemies, self.player.current_attack['damage'])
+            for enemy in hit_enemies:
+                enemy.apply_knockback(
+                    self.player.current_attack['knockback_x'] * (1 if self.player.facing_right else -1),
+                    self.player.current_attack['knockback_y'],
+                    stun_duration=0.3
+                )
+                
+                # Screen shake on finisher combo (5 hits = max combo)
+                if self.rhythm_system.combo_count >= 5:
+                    self.trigger_screen_shake(intensity=0.8, duration=0.15)
             
             # Deactivate attack after one frame
             self.player.current_attack['active'] = False
@@ -1077,9 +1175,17 @@ class Game:
             for i in range(seg - 2, seg + 3):
                 if i not in self.level_data["segments"]:
                     self.level_data["generate_segment"](i)
+            # Evict segments left far behind (or ahead) so the live lists stay bounded
+            evict_segment = self.level_data.get("evict_segment")
+            if evict_segment is not None:
+                keep = self.config.SEGMENT_KEEP_DISTANCE
+                far = [i for i in self.level_data["segments"] if abs(i - seg) > keep]
+                for i in far:
+                    evict_segment(i, seg, keep)
         
         # ========== Update Player Physics ==========
-        rects = self.get_collision_rects()
+        # Only terrain near the player can be touched this frame
+        rects = self.get_collision_rects(near=self.player.rect)
         
         # Handle stun and knockback
         self.player.update_stun_and_knockback(dt, rects)
@@ -1123,12 +1229,6 @@ class Game:
     # ==================== RENDERING ====================
     def draw(self):
         """Draw everything on screen - runs every frame"""
-        # Clear screen to sky color
-        self.screen.fill(self.config.COLOR_SKY)
-        
-        # Draw city background image if in City level
-        self._draw_city_background()
-
         # City-specific transparency overrides (show background art)
         is_city = self.level_data.get('level_id') == 'city' if self.level_data else False
         orig_ground_alpha = self.config.ALPHA_GROUND
@@ -1137,18 +1237,19 @@ class Game:
             self.config.ALPHA_GROUND = 0
             self.config.ALPHA_WALL = 0
         
-        # ========== Draw all game objects ==========
-        # Draw in order: ground, platforms, objects, coins, drops, enemies, player
-        # (Order matters: things drawn first appear behind things drawn last)
-        self._draw_ground()
-        self._draw_platforms()
-        self._draw_natural_objects()
-        self._draw_interactables()
-        self._draw_coins()
-        self._draw_drops()
-        
-        self._draw_enemies()
-        self._draw_player()
+        # The world is paused while a menu is open, so its layers are drawn once
+        # into a snapshot and reused until the menu closes or the view changes
+        backdrop_key = (self.screen.get_size(), id(self.level_data), self.camera_x, self.camera_y,
+                        tuple(self.player.rect))
+        if self.active_menu and self._menu_backdrop is not None and self._menu_backdrop_key == backdrop_key:
+            self.screen.blit(self._menu_backdrop, (0, 0))
+        else:
+            self._draw_world()
+            if self.active_menu:
+                self._menu_backdrop = self.screen.copy()
+                self._menu_backdrop_key = backdrop_key
+            else:
+                self._menu_backdrop = None
         
         # Draw UI elements
         self._draw_interaction_icons()
@@ -1167,11 +1268,37 @@ class Game:
             self.config.ALPHA_WALL = orig_wall_alpha
         
         # Scale the internal screen to display surface with smooth scaling for better visuals
-        scaled = pygame.transform.smoothscale(self.screen, (self.config.SCREEN_WIDTH, self.config.SCREEN_HEIGHT))
-        self.display_surface.blit(scaled, (0, 0))
+        display_size = (self.config.SCREEN_WIDTH, self.config.SCREEN_HEIGHT)
+        if self.screen.get_size() == display_size:
+            # 1.0 zoom: the internal screen already matches the display
+            self.display_surface.blit(self.screen, (0, 0))
+        else:
+            scaled = pygame.transform.smoothscale(self.screen, display_size)
+            self.display_surface.blit(scaled, (0, 0))
         
         pygame.display.flip()
 
+    def _draw_world(self):
+        """Draw the level and everything in it (no UI)"""
+        # Clear screen to sky color
+        self.screen.fill(self.config.COLOR_SKY)
+        
+        # Draw city background image if in City level
+        self._draw_city_background()
+        
+        # ========== Draw all game objects ==========
+        # Draw in order: ground, platforms, objects, coins, drops, enemies, player
+        # (Order matters: things drawn first appear behind things drawn last)
+        self._draw_ground()
+        self._draw_platforms()
+        self._draw_natural_objects()
+        self._draw_interactables()
+        self._draw_coins()
+        self._draw_drops()
+        
+        self._draw_enemies()
+        self._draw_player()
+
     def _draw_city_background(self):
         """Draw the city background image scaled to screen when in the City level"""
         try:
@@ -1209,20 +1336,57 @@ class Game:
             screen_rect = p.move(-self.camera_x, -self.camera_y)
             self._draw_with_alpha(self.screen, self.config.COLOR_PLATFORM, screen_rect, self.config.ALPHA_PLATFORM)
 
+    def _build_scene_index(self, objects):
+        """Sort a level list's objects by left edge for viewport lookups
+        
+        Returns (order, lefts, reach) where reach[i] is the furthest right edge
+        among the first i+1 sorted objects, so both arrays are ascending.
+        """
+        lefts = np.empty(len(objects), dtype=np.float64)
+        rights = np.empty(len(objects), dtype=np.float64)
+        for i, obj in enumerate(objects):
+            rect = getattr(obj, "rect", None)
+            if rect is None:
+                lefts[i], rights[i] = -np.inf, np.inf  # Unknown extent: always drawn
+            else:
+                lefts[i], rights[i] = rect.left, rect.right
+        order = np.argsort(lefts, kind="stable")
+        return order, lefts[order], np.maximum.accumulate(rights[order])
+
+    def _visible_objects(self, key):
+        """Objects in level_data[key] that may overlap the viewport horizontally, in list order"""
+        objects = self.level_data.get(key, [])
+        cached = self._scene_index.get(key)
+        # Levels only extend, filter-replace or remove from these lists, so identity + length spots changes
+        if cached is None or cached[0] is not objects or cached[1] != len(objects):
+            cached = (objects, len(objects), *self._build_scene_index(objects))
+            self._scene_index[key] = cached
+        _, _, order, lefts, reach = cached
+        
+        view_left = self.camera_x - 1
+        view_right = self.camera_x + self.screen.get_width() + 1
+        lo = np.searchsorted(reach, view_left, side="left")
+        hi = np.searchsorted(lefts, view_right, side="right")
+        if lo >= hi:
+            return []
+        # Restore list order so overlapping objects keep their stacking
+        return [objects[i] for i in np.sort(order[lo:hi])]
+
     def _draw_natural_objects(self):
         """Draw natural objects (rocks, tents, slopes)"""
-        for obj in self.level_data.get("natural_objects", []):
+        for obj in self._visible_objects("natural_objects"):
             if hasattr(obj, "draw"):
                 obj.draw(self.screen, self.camera_x, self.camera_y, self.config)
 
     def _draw_interactables(self):
         """Draw interactable objects"""
-        for obj in self.level_data.get("interactables", []):
-            if hasattr(obj, "draw"):
-                obj.draw(self.screen, self.camera_x, self.camera_y, self.config)
-            else:
-                screen_rect = obj.rect.move(-self.camera_x, -self.camera_y)
-                self._draw_with_alpha(self.screen, self.config.COLOR_INTERACTABLE, screen_rect, self.config.ALPHA_INTERACTABLE)
+        draw_interactables(self.screen, self._visible_objects("interactables"),
+                           self.camera_x, self.camera_y, self.config, self._draw_plain_interactable)
+
+    def _draw_plain_interactable(self, obj):
+        """Fallback for interactables that have no draw method of their own"""
+        screen_rect = obj.rect.move(-self.camera_x, -self.camera_y)
+        self._draw_with_alpha(self.screen, self.config.COLOR_INTERACTABLE, screen_rect, self.config.ALPHA_INTERACTABLE)
 
     def _draw_coins(self):
         """Draw coins"""
@@ -1232,8 +1396,6 @@ class Game:
 
     def _spawn_enemy_drops(self, enemy, count=5):
         """Spawn coins that fan out on enemy death"""
-        from Assets.Interactables import Coin
-        
         # Calculate experience based on enemy level
         exp_table = {
             1: 1, 2: 2, 3: 4, 4: 6, 5: 10,
@@ -1273,8 +1435,6 @@ class Game:
         if not self.drops:
             return  # No drops to update
         
-        from Assets.Interactables import Coin
-        
         # Physics constants
         gravity = 800  # Strong gravity for satisfying arc
         damping = 0.92 ** (dt * 60)  # Slight air resistance
@@ -1347,7 +1507,6 @@ class Game:
 
     def _draw_drops(self):
         """Draw all drop circles on screen"""
-        from Assets.Interactables import Coin
         for drop in self.drops:
             # If it's a Coin object, use its draw method
             if isinstance(drop, Coin):
@@ -1620,8 +1779,11 @@ class Game:
     def _draw_go_back_fade(self):
         """Draw fade effect for go back"""
         if self.go_back_fade_phase:
-            fade_surface = pygame.Surface((self.screen.get_width(), self.screen.get_height()))
-            fade_surface.fill((0, 0, 0))
+            fade_surface = self._fade_surface
+            if fade_surface is None or fade_surface.get_size() != self.screen.get_size():
+                fade_surface = pygame.Surface(self.screen.get_size())
+                fade_surface.fill((0, 0, 0))
+                self._fade_surface = fade_surface
             fade_surface.set_alpha(self.go_back_fade_alpha)
             self.screen.blit(fade_surface, (0, 0))
 
@@ -4,6 +4,7 @@ Test script to verify new features are working
 - Gold system in MainCharacter
 - Coin class with bobbing
 - Rhythm circle reset
+- Dark Forest spatial hash matches brute-force collision
 """
 
 import sys
@@ -66,6 +67,55 @@ except Exception as e:
     else:
         print(f"✗ RhythmBattleSystem test failed: {e}")
 
+# Test 4: SpatialHash finds the same terrain as a brute-force colliderect scan
+try:
+    import random
+    import pygame
+    from Assets.Levels.Dark_Forest import SpatialHash, load_level
+    
+    rng = random.Random(1234)
+    
+    def random_rect():
+        return pygame.Rect(rng.randint(-3000, 3000), rng.randint(-500, 1500),
+                           rng.randint(1, 900), rng.randint(1, 400))
+    
+    def check_against_brute_force(terrain, rects):
+        assert len(terrain) == len(rects), "SpatialHash size differs from live terrain"
+        for _ in range(300):
+            probe = random_rect()
+            expected = [r for r in rects if probe.colliderect(r)]
+            found = terrain.query(probe)
+            assert sorted(map(id, found)) == sorted(map(id, expected)), "query() differs from colliderect scan"
+            assert terrain.collides(probe) == bool(expected), "collides() differs from colliderect scan"
+    
+    # Insert and remove on a standalone hash
+    terrain = SpatialHash()
+    rects = [random_rect() for _ in range(200)]
+    for r in rects:
+        terrain.insert(r)
+    check_against_brute_force(terrain, rects)
+    for r in rects[::3]:
+        terrain.remove(r)
+    rects = [r for i, r in enumerate(rects) if i % 3]
+    check_against_brute_force(terrain, rects)
+    
+    # Dark Forest ground and platforms through a generate/evict cycle
+    level = load_level()
+    terrain = level["spatial_hash"]
+    check_against_brute_force(terrain, level["ground"] + level["platforms"])
+    for i in range(6, 20):
+        level["generate_segment"](i)
+    for i in [i for i in level["segments"] if abs(i - 16) > 8]:
+        level["evict_segment"](i, 16, 8)
+    check_against_brute_force(terrain, level["ground"] + level["platforms"])
+    for i in range(-2, 8):
+        level["generate_segment"](i)
+    check_against_brute_force(terrain, level["ground"] + level["platforms"])
+    
+    print("✓ Dark Forest spatial hash matches brute-force collision")
+except Exception as e:
+    print(f"✗ Spatial hash test failed: {e}")
+
 print("\n✓ All features implemented successfully!")
 print("\nFeature Summary:")
 print("1. Gold system: Player now has gold attribute that increases when collecting coins")
@@ -73,3 +123,4 @@ print("2. Coins: Enemies drop coins on death that bob up/down and give gold when
 print("3. Coin physics: Coins have velocity (vx, vy) for spray effect and lifetime for despawn")
 print("4. Rhythm circle: Resets BPM when song changes for proper beat synchronization")
 print("5. Music transitions: Music plays when changing levels")
+print("6. Dark Forest terrain: Collision queries go through a spatial hash")